@@ -1,5 +1,6 @@
 """Custom Rasa actions for recipe bot with spaCy-enhanced parsing."""
 
+import json
 from typing import Any
 
 from rasa_sdk import Action, Tracker
@@ -28,6 +29,15 @@ def clean_url(url: str) -> str:
     return url
 
 
+def drop_none(value: Any) -> Any:
+    """Recursively remove None-valued keys from JSON-like data."""
+    if isinstance(value, dict):
+        return {key: drop_none(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [drop_none(item) for item in value]
+    return value
+
+
 class ActionFetchRecipe(Action):
     """Fetch and parse recipe from URL."""
 
@@ -70,7 +80,9 @@ class ActionFetchRecipe(Action):
             )
 
             return [
-                SlotSet("recipe_data", recipe_data.dict()),
+                # .json() serializes the nested dataclasses; .dict() would leave them as objects.
+                # Unset fields are dropped so step time/temperature only carry the keys that were found.
+                SlotSet("recipe_data", drop_none(json.loads(recipe_data.json()))),
                 SlotSet("recipe_title", recipe_data.title),
                 SlotSet("total_steps", len(recipe_data.steps)),
                 SlotSet("current_step", 0),
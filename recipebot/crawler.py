@@ -1,16 +1,45 @@
+from functools import lru_cache
+
 import requests
-from bs4 import BeautifulSoup
 
 from recipebot.model import Ingredient
 
 
-def scrape_raw_html(url: str) -> str:
-    """Scrape raw HTML from URL."""
+def _make_soup(response: requests.Response):
+    """Parse a response body with the lxml tree builder, falling back to the pure-Python parser.
+
+    The raw bytes are handed to the parser so decoding happens once during tokenization
+    instead of first building `response.text`.
+    """
+    # Deferred so importing the crawler (e.g. for scrape_raw_html) doesn't pay for bs4
+    from bs4 import BeautifulSoup, FeatureNotFound
+
+    # Only trust an explicit charset; otherwise let the parser sniff <meta charset>
+    content_type = response.headers.get("content-type", "")
+    encoding = response.encoding if "charset" in content_type.lower() else None
+    try:
+        return BeautifulSoup(response.content, "lxml", from_encoding=encoding)
+    except FeatureNotFound:
+        return BeautifulSoup(response.content, "html.parser", from_encoding=encoding)
+
+
+def _fetch(url: str) -> requests.Response:
+    """Download a page, raising for HTTP errors.
+
+    Deliberately not memoized: the bot should always see the live page, and parsed recipes
+    are already cached per URL by the parser.
+    """
     response = requests.get(url)
     response.raise_for_status()
-    return response.text
+    return response
+
+
+def scrape_raw_html(url: str) -> str:
+    """Scrape raw HTML from URL."""
+    return _fetch(url).text
 
 
+@lru_cache(maxsize=256)
 def extract_title_from_url(url: str) -> str:
     """Extract recipe title from URL."""
     # Extract last part of URL path and clean it up
@@ -54,33 +83,34 @@ def scrape_recipe(url):
 
 
 def scrape_allrecipes(url):
-    response = requests.get(url)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = _make_soup(_fetch(url))
 
     # Ingredients
     ingredients = []
     for item in soup.select(".mm-recipes-structured-ingredients__list li"):
-        ingredient = Ingredient(
-            name=item.select_one("span[data-ingredient-name]").get_text(strip=True),
-            quantity=item.select_one("span[data-ingredient-quantity]").get_text(strip=True),
-            unit=res.get_text(strip=True)
-            if (res := item.select_one("span[data-ingredient-unit]")) is not None
-            else None,
-            preparation=res.get_text(strip=True)
+        name = item.select_one("span[data-ingredient-name]").get_text(strip=True)
+        quantity = item.select_one("span[data-ingredient-quantity]").get_text(strip=True)
+        unit = res.get_text(strip=True) if (res := item.select_one("span[data-ingredient-unit]")) is not None else None
+        preparation = (
+            res.get_text(strip=True)
             if (res := item.select_one("span[data-ingredient-preparation]")) is not None
-            else None,
+            else None
         )
 
         # Catch any remaining text or spans as "misc"
-        misc_parts = [
-            t.strip()
-            for t in item.stripped_strings
-            if t.strip() not in {ingredient.quantity, ingredient.unit, ingredient.name, ingredient.preparation}
-        ]
-        if misc_parts:
-            ingredient.misc = "".join(misc_parts)
-        ingredients.append(ingredient)
+        known = {quantity, unit, name, preparation}
+        misc_parts = [t.strip() for t in item.stripped_strings if t.strip() not in known]
+
+        # Built once all fields are known, so the ingredient is never modified afterwards
+        ingredients.append(
+            Ingredient(
+                name=name,
+                quantity=quantity,
+                unit=unit,
+                preparation=preparation,
+                misc="".join(misc_parts) if misc_parts else None,
+            )
+        )
 
     # Directions
     directions = []
@@ -98,42 +128,36 @@ def scrape_allrecipes(url):
 
 
 def scrape_seriouseats(url):
-    response = requests.get(url)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = _make_soup(_fetch(url))
 
     # Ingredients
     ingredients = []
     for item in soup.select(".structured-ingredients__list-item"):
-        i = Ingredient(name=None, quantity=None, unit=None, preparation=None, misc=None)
-
+        # First non-empty span of each kind wins
+        fields: dict[str, str] = {}
         for span in item.select(
             "span[data-ingredient-quantity], span[data-ingredient-unit], span[data-ingredient-name], span[data-ingredient-preparation]"  # noqa: E501
         ):
             text = span.get_text(strip=True)
             if not text:
                 continue
-            if span.has_attr("data-ingredient-quantity") and i.quantity is None:
-                i.quantity = text
-            elif span.has_attr("data-ingredient-unit") and i.unit is None:
-                i.unit = text
-            elif span.has_attr("data-ingredient-name") and i.name is None:
-                i.name = text
-            elif span.has_attr("data-ingredient-preparation") and i.preparation is None:
-                i.preparation = text
+            for field in ("quantity", "unit", "name", "preparation"):
+                if span.has_attr(f"data-ingredient-{field}") and field not in fields:
+                    fields[field] = text
+                    break
+
+        # Skip ingredient if it has no name
+        if "name" not in fields:
+            continue
 
         # Catch any remaining text as "misc"
-        misc_parts = [
-            t.strip()
-            for t in item.stripped_strings
-            if t.strip() not in {i.quantity, i.unit, i.name, i.preparation} and t.strip()
-        ]
+        known = set(fields.values())
+        misc_parts = [t.strip() for t in item.stripped_strings if t.strip() not in known and t.strip()]
         if misc_parts:
-            i.misc = " ".join(misc_parts)
+            fields["misc"] = " ".join(misc_parts)
 
-        # Skip ingredient if it has no name
-        if i.name:
-            ingredients.append(i)
+        # Built once all fields are known, so the ingredient is never modified afterwards
+        ingredients.append(Ingredient(**fields))
 
     # Directions
     directions = []
@@ -1,14 +1,34 @@
-import json
-from dataclasses import dataclass
-
-from pydantic_ai import Agent, RunContext
-
-from recipebot.crawler import scrape_raw_html, scrape_recipe
-from recipebot.llm.agent import format_recipe_for_llm
-from recipebot.model import Recipe
-from recipebot.search import search_duckduckgo, search_youtube
-
-INSTRUCTION = """You are a knowledgeable and friendly culinary assistant designed to help users understand and follow recipes.
+import asyncio
+import hashlib
+import re
+import sys
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Literal
+
+from pydantic import TypeAdapter
+from pydantic_ai import Agent, RunContext, UnexpectedModelBehavior
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    ModelResponseStreamEvent,
+    PartDeltaEvent,
+    PartStartEvent,
+    TextPart,
+    TextPartDelta,
+    ToolCallPart,
+    ToolReturnPart,
+)
+from pydantic_ai.models.google import GoogleModelSettings
+
+from recipebot.llm.agent import fetch_recipe_text
+from recipebot.model import Ingredient, Recipe, Step
+from recipebot.search import SearchResult, search_duckduckgo, search_youtube
+
+# Always sent: role, recipe JSON access, navigation and the vague-reference rules
+INSTRUCTION_CORE = """You are a knowledgeable and friendly culinary assistant designed to help users understand and follow recipes.
 Your primary role is to interpret recipe information, answer questions, and guide users through the cooking process step-by-step.
 
 ## Your Capabilities
@@ -44,7 +64,11 @@ The complete recipe is provided as JSON in the system prompt, including:
 - `directions`: Raw cooking directions (as written in original recipe)
 - `steps`: Parsed atomic steps (one direction may be split into multiple steps)
   - Each step has: step_number, description, ingredients, tools, time, temperature
-- `current_step`: Current step number (refers to parsed steps, 0 means not started)
+
+The user's position is given right after the recipe JSON as a `current_step: N` line
+(refers to parsed steps, 0 means not started).
+
+Fields that are empty, null, or at their default value (e.g. `actionable: true`) are omitted from the JSON.
 
 **Important**: The `current_step` refers to parsed steps (in the `steps` array), not raw directions.
 
@@ -72,7 +96,7 @@ Support moving through recipe steps:
 
 **Response**:
 - Use the `navigate_step` tool to update the current step
-- After navigation, read the recipe JSON from the system context to get the new step's details
+- The tool returns the new step's details as JSON; present them directly
 - Display the new step with: step number, description, ingredients (if any), and tools (if any)
 - Acknowledge the navigation (e.g., "Moving to step 3...")
 
@@ -85,7 +109,7 @@ Answer questions about specific parameters in the current or any step:
 - "What can I use instead of butter?"
 
 **Response Strategy**:
-- Check the current step first (current_step field in JSON)
+- Check the current step first (the `current_step` line)
 - Look up the step in the `steps` array
 - If the ingredient/parameter is in the current step, answer directly
 - If not in current step, search all steps in the `steps` array
@@ -99,10 +123,6 @@ Provide definitions and explanations:
 
 **Response**:
 - Provide clear definitions using your culinary knowledge
-- **ALWAYS automatically search for YouTube videos** using the `search_youtube` tool when users ask "what is" or "what does" questions
-- **IMPORTANT**: Include 2-3 relevant videos with FULL YouTube URLs (not just titles) in this format:
-  - "Video Title" - https://www.youtube.com/watch?v=VIDEO_ID (Duration: X minutes)
-- No need to ask the user if they want a video - just include it automatically
 
 ### 5. Procedure Questions
 Explain how to perform actions or techniques:
@@ -117,9 +137,6 @@ Explain how to perform actions or techniques:
   - Example: Current step mentions baking time, user asks "how long should I do" → Provide the baking time from the current step
 - For specific techniques, provide step-by-step instructions
 - Break down complex techniques into simple sub-steps
-- **ALWAYS automatically search for YouTube videos** using the `search_youtube` tool when users ask "how do I" or "how to" questions
-- **IMPORTANT**: Include 2-3 relevant videos with FULL YouTube URLs (not just titles) in this format:
-  - "Video Title" - https://www.youtube.com/watch?v=VIDEO_ID (Duration: X minutes)
 
 ### 6. Quantity Questions
 Answer about ingredient amounts:
@@ -145,20 +162,12 @@ Answer about ingredient amounts:
 
 2. **Step Navigation**:
    - Use the `navigate_step` tool when the user explicitly requests to change steps
-   - After using `navigate_step`, always read the recipe JSON to get the step details and present them to the user
-   - The recipe JSON is provided in the system instructions with the current_step number
-
-3. **External Search**:
-   - **ALWAYS use `search_youtube`** automatically when users ask "what is", "what does", "how do I", or "how to" questions
-   - **CRITICAL**: When presenting YouTube search results, ALWAYS include the FULL video URLs (https://www.youtube.com/watch?v=VIDEO_ID), not just titles
-   - Format: "Video Title" - https://www.youtube.com/watch?v=VIDEO_ID (Duration: X minutes)
-   - Include 2-3 relevant videos with their complete URLs
-   - Use `search_duckduckgo` for text-based information when needed
-   - Use external search when users ask about alternatives, substitutions, or questions unrelated to the recipe
-
-4. **Vague References - NEVER Ask for Clarification, ALWAYS Answer**: When users say "this", "that", "it", "here", "now", "in this step", or ask vague questions like "how do I?" or "how much of that?":
+   - `navigate_step` returns the new step's details - present them to the user
+   - The recipe JSON is provided in the system instructions, followed by the current_step number
+
+3. **Vague References - NEVER Ask for Clarification, ALWAYS Answer**: When users say "this", "that", "it", "here", "now", "in this step", or ask vague questions like "how do I?" or "how much of that?":
    - **NEVER ask for clarification - ALWAYS provide a direct answer**
-   - Look at the current_step number (in the JSON)
+   - Look at the current_step number (after the recipe JSON)
    - Look up that step in the steps array
    - Use that step's ingredients, tools, description, time/temperature
    - Examples of proper responses:
@@ -167,30 +176,90 @@ Answer about ingredient amounts:
      * User asks "how long should I do?" → Extract time/duration from current step description
    - The current step context ALWAYS provides enough information to answer vague questions
 
-5. **Never Ask for Step Numbers**: The current_step is always in the JSON. Infer from conversation history.
+4. **Never Ask for Step Numbers**: The current_step is always given after the recipe JSON. Infer from conversation history.
 
 ## Important Notes
 
 - Recipe information is provided as JSON in the instructions - parse it directly to answer questions
-- The recipe JSON includes a `current_step` field showing where the user is in the recipe
+- The `current_step` line after the recipe JSON shows where the user is in the recipe
 - The recipe JSON includes `steps` array with all step details (description, ingredients, tools, time, temperature)
 - When user asks to "show all steps" or "display all steps", list ALL steps from the `steps` array, not just the current step
-- After using `navigate_step` tool, read the recipe JSON to get the new step's details from the `steps` array
-- Only use tools when necessary (navigation with `navigate_step`, external search)
+- The `navigate_step` tool returns the new step's details, so no extra lookup is needed
+- Only use tools when necessary
 - Always confirm navigation commands and show the new step details
 - **NEVER mention what tools you can or cannot use** - just provide direct, confident answers
 - **NEVER say "I can't search" or "I don't have a tool for"** - parse the recipe JSON and answer directly
 - Be patient, clear, and helpful in all responses
 """  # noqa: E501
 
+# Only sent to the agent that has the search tools (definition, technique and substitution questions)
+INSTRUCTION_TOOLS = """
+## External Search
+
+- **ALWAYS automatically search for YouTube videos** using the `search_youtube` tool when users ask "what is", "what does", "how do I", or "how to" questions
+- No need to ask the user if they want a video - just search automatically
+- The videos returned by `search_youtube` are shown to the user automatically below your reply
+- **Do NOT repeat video titles or URLs in your reply** - at most mention that related videos are shown below
+- Use `search_duckduckgo` for text-based information when needed
+- Use external search when users ask about alternatives, substitutions, or questions unrelated to the recipe
+"""  # noqa: E501
+
+INSTRUCTION = INSTRUCTION_CORE + INSTRUCTION_TOOLS
+
 MODEL = "gemini-2.5-flash"
+# Cheaper, faster model for turns that don't need technique explanations or search
+MODEL_LITE = "gemini-2.5-flash-lite"
+
+# Chat turns are short, grounded answers: skip thinking tokens and cap the decode budget.
+# Recipe parsing keeps the model defaults since a full Recipe can be long.
+ASK_MODEL_SETTINGS = GoogleModelSettings(
+    google_thinking_config={"thinking_budget": 0},
+    temperature=0.2,
+    max_tokens=2048,
+)
+
+# Maximum number of answers kept in HybridAgent's response cache
+RESPONSE_CACHE_SIZE = 256
+
+
+_STEP_ADAPTER = TypeAdapter(Step)
 
 
-@dataclass
+def _format_step(step_number: int, step: Step, total_steps: int) -> str:
+    """Render the navigate_step response for a single step.
+
+    Args:
+        step_number: 1-based position of the step
+        step: The parsed step
+        total_steps: Number of steps in the recipe
+
+    Returns:
+        str: Navigation confirmation followed by the step as JSON
+    """
+    step_json = _STEP_ADAPTER.dump_json(step, exclude_none=True, exclude_defaults=True).decode()
+    return (
+        f"Successfully navigated to step {step_number} of {total_steps}. "
+        f"Present this step to the user:\n```json\n{step_json}\n```"
+    )
+
+
+@dataclass(slots=True)
 class Deps:
     """Dependencies for the hybrid agent - only mutable state."""
 
     current_step: int
+    # Pre-rendered navigate_step responses, one per step (built once per loaded recipe)
+    step_responses: list[str] = field(default_factory=list)
+
+
+# Maps each navigation action to (current, max_steps, step_number) -> new step
+_ACTIONS: dict[str, Callable[[int, int, int | None], int]] = {
+    "next": lambda c, m, _: min(c + 1, m),
+    "previous": lambda c, m, _: max(c - 1, 1),
+    "first": lambda c, m, _: 1,
+    "repeat": lambda c, m, _: min(max(c, 1), m),
+    "goto": lambda c, m, n: max(1, min(n, m)),
+}
 
 
 def navigate_step(ctx: RunContext[Deps], action: str, step_number: int | None = None) -> str:
@@ -202,72 +271,207 @@ def navigate_step(ctx: RunContext[Deps], action: str, step_number: int | None =
         step_number: Required for "goto" action, ignored for others
 
     Returns:
-        str: Confirmation that step was updated. The LLM should then read the recipe JSON
-             from the system prompt to get the details of the new step.
+        str: Confirmation that step was updated, including the new step's details when
+             they were pre-rendered at load time.
     """
-    current = ctx.deps.current_step
-
-    if action == "next":
-        new_step = current + 1
-    elif action == "previous":
-        new_step = max(current - 1, 1)
-    elif action == "first":
-        new_step = 1
-    elif action == "repeat":
-        new_step = current
-    elif action == "goto":
-        if step_number is None:
-            return "Please specify a step number for 'goto' action."
-        new_step = max(1, step_number)
-    else:
+    return _navigate(ctx.deps, action, step_number)
+
+
+def _navigate(deps: Deps, action: str, step_number: int | None = None) -> str:
+    """Apply a navigation action to deps; shared by the tool and the fast path in `HybridAgent.ask`."""
+    fn = _ACTIONS.get(action)
+    if fn is None:
         return f"Invalid action '{action}'. Use: next, previous, goto, first, or repeat."
+    if action == "goto" and step_number is None:
+        return "Please specify a step number for 'goto' action."
+
+    step_responses = deps.step_responses
+    new_step = fn(deps.current_step, len(step_responses) or sys.maxsize, step_number)
+
+    if step_responses:
+        deps.current_step = new_step
+        return step_responses[new_step - 1]
 
-    ctx.deps.current_step = new_step
+    deps.current_step = new_step
 
     return f"Successfully navigated to step {new_step}. Now read the recipe JSON from the system context to get the details of step {new_step} and present them to the user."  # noqa: E501
 
 
+# Utterances that are answered from local data without calling the LLM. Both patterns
+# must match the whole message so anything with extra content still reaches the agent.
+_NAV_RE = re.compile(
+    r"^\s*(?:"
+    r"(?:go\s+to\s+)?(?:the\s+)?(?P<next>next)(?:\s+step)?"
+    r"|(?:go\s+)?(?P<previous>previous|back)(?:\s+(?:one\s+)?step)?"
+    r"|(?P<repeat>repeat)(?:\s+(?:that|step))?(?:\s+please)?"
+    r"|(?P<first>start\s+over|(?:go\s+to\s+|take\s+me\s+to\s+)?(?:the\s+)?first\s+step)"
+    r"|(?:go\s+to\s+|take\s+me\s+to\s+)?step\s+(?P<goto>\d+)"
+    r")\s*[.!?]*\s*$",
+    re.IGNORECASE,
+)
+_SHOW_RE = re.compile(
+    r"^\s*(?:show|list|display)(?:\s+me)?\s+(?:the\s+)?(?:(?P<ingredients>ingredients?)(?:\s+list)?|all\s+(?:the\s+)?steps)"
+    r"\s*[.!?]*\s*$",
+    re.IGNORECASE,
+)
+
+
+def _format_ingredient(ingredient: Ingredient) -> str:
+    """Render an ingredient as a single list line, e.g. "2 cups flour, sifted"."""
+    line = " ".join(part for part in (ingredient.quantity, ingredient.unit, ingredient.name) if part)
+    if ingredient.preparation:
+        line += f", {ingredient.preparation}"
+    return f"- {line}"
+
+
+def _format_step_for_user(step_number: int, step: Step, total_steps: int) -> str:
+    """Render a step the way the agent presents it after navigation."""
+    lines = [f"Step {step_number} of {total_steps}: {step.description}"]
+    if step.ingredients:
+        lines.append("Ingredients: " + ", ".join(i.name for i in step.ingredients if i.name))
+    if step.tools:
+        lines.append("Tools: " + ", ".join(step.tools))
+    # Blank-line separated so the chat frontends' Markdown rendering keeps the lines apart
+    return "\n\n".join(lines)
+
+
+def _used_tools(messages: list[ModelMessage]) -> bool:
+    """Whether the model called any tool during a run."""
+    return any(
+        isinstance(part, ToolCallPart)
+        for message in messages
+        if isinstance(message, ModelResponse)
+        for part in message.parts
+    )
+
+
+def _collect_videos(messages: list[ModelMessage]) -> list[SearchResult]:
+    """Gather the results of every search_youtube call made during a run."""
+    return [
+        video
+        for message in messages
+        if isinstance(message, ModelRequest)
+        for part in message.parts
+        if isinstance(part, ToolReturnPart) and part.tool_name == "search_youtube"
+        for video in part.content
+    ]
+
+
+def _text_delta(event: ModelResponseStreamEvent) -> str | None:
+    """Return the text an agent stream event adds to the response, or None if it adds none."""
+    if isinstance(event, PartStartEvent) and isinstance(event.part, TextPart):
+        return event.part.content or None
+    if isinstance(event, PartDeltaEvent) and isinstance(event.delta, TextPartDelta):
+        return event.delta.content_delta or None
+    return None
+
+
+def _parse_prompt(recipe_text: str) -> str:
+    """Build the prompt asking the agent to parse scraped recipe text into a Recipe."""
+    return f"Please parse this recipe and extract all information:\n\n{recipe_text}"
+
+
+def _describe_error(e: Exception) -> str:
+    """Format an exception (and its cause) for display to the user."""
+    error_msg = str(e)
+    if e.__cause__:
+        error_msg += f"\nCause: {e.__cause__}"
+    return error_msg
+
+
+# Questions that call for explanations, substitutions or external search go to the full model
+_HEAVY_RE = re.compile(
+    r"\b(?:how\s+(?:do|can|should|would)\s+i|how\s+to|what\s+(?:is|are|does|do)|why"
+    r"|substitut\w*|instead\s+of|alternatives?|replace\w*|videos?|search|look\s+up)\b",
+    re.IGNORECASE,
+)
+
+
+def _classify(question: str) -> Literal["simple", "heavy"]:
+    """Classify a question by how much model capability it needs.
+
+    Args:
+        question: The user's message
+
+    Returns:
+        "heavy" for technique, definition, substitution or search questions, otherwise "simple"
+    """
+    return "heavy" if _HEAVY_RE.search(question) else "simple"
+
+
 class HybridAgent:
     """Hybrid recipe assistant using pydantic_ai with external search capabilities."""
 
-    def __init__(self):
-        """Initialize the hybrid agent with pydantic_ai Agent."""
-        self.agent = Agent(
-            model=MODEL,
-            retries=5,
-            instructions=INSTRUCTION,
-            tools=[
-                navigate_step,
-                search_duckduckgo,
-                search_youtube,
-            ],
-            deps_type=Deps,
-        )
+    # Agents keep no per-session state (that lives in Deps), so every instance shares them
+    _agents: ClassVar[dict[tuple[str, bool], Agent[Deps, str]]] = {}
 
-        @self.agent.system_prompt
-        def _get_current_step(ctx: RunContext[Deps]) -> str:
-            return f"Current step: {ctx.deps.current_step}"
+    def __init__(self):
+        """Initialize the hybrid agent with pydantic_ai Agents."""
+        self.agent_flash = self._get_agent(MODEL)
+        # Simple turns never search, so they skip the search tools and their instructions
+        self.agent_lite = self._get_agent(MODEL_LITE, with_search=False)
+        # Recipe parsing always uses the full model
+        self.agent = self.agent_flash
 
         self.current_recipe: Recipe | None = None
         self.current_step: int = 0
+        # Serialized recipe, built once per load so the instruction prefix is byte-identical across turns
+        self._recipe_json: str | None = None
+        self._step_responses: list[str] = []
+        # LRU of plain-text answers; replies that called tools are never cached since tools mutate state
+        self._response_cache: OrderedDict[bytes, str] = OrderedDict()
+        # Videos found by search_youtube during the last ask; frontends render these themselves
+        self.last_videos: list[SearchResult] = []
+
+    @classmethod
+    def _get_agent(cls, model: str, with_search: bool = True) -> Agent[Deps, str]:
+        """Return the shared agent for `model`, building it on first use."""
+        key = (model, with_search)
+        if key not in cls._agents:
+            cls._agents[key] = cls._build_agent(model, with_search)
+        return cls._agents[key]
+
+    @staticmethod
+    def _build_agent(model: str, with_search: bool = True) -> Agent[Deps, str]:
+        """Create an agent for `model`.
+
+        Args:
+            model: Gemini model name
+            with_search: If True, register the search tools and their instructions.
+                        Otherwise the agent only gets the core prompt and navigation.
+
+        Returns:
+            Agent[Deps, str]: The configured agent
+        """
+        tools = [navigate_step, search_duckduckgo, search_youtube] if with_search else [navigate_step]
+        return Agent(
+            model=model,
+            retries=2,
+            instructions=INSTRUCTION if with_search else INSTRUCTION_CORE,
+            tools=tools,
+            deps_type=Deps,
+        )
+
+    def _agent_for(self, question: str) -> Agent[Deps, str]:
+        """Pick the lite or full agent for a question."""
+        return self.agent_flash if _classify(question) == "heavy" else self.agent_lite
 
     def _get_recipe_context(self) -> str:
         """Get the recipe as JSON string for system prompt.
 
         Returns:
-            str: JSON representation of the recipe with current_step
+            str: Compact JSON representation of the recipe (without current_step)
         """
         if not self.current_recipe:
             return "{}"
 
-        # Dump recipe as dict
-        recipe_dict = self.current_recipe.model_dump()
-
-        # Add current_step to the dict
-        recipe_dict["current_step"] = self.current_step
+        # The recipe is immutable once loaded, so serialize it once
+        if self._recipe_json is None:
+            # pydantic-core serializes straight from the model in Rust, no intermediate dict.
+            # Compact and without null/default fields: the model doesn't need the whitespace.
+            self._recipe_json = self.current_recipe.model_dump_json(exclude_none=True, exclude_defaults=True)
 
-        # Convert to formatted JSON
-        return json.dumps(recipe_dict, indent=2)
+        return self._recipe_json
 
     def load_recipe(self, url: str, parse_html: bool = False) -> Recipe:
         """Load a recipe from URL and return Recipe.
@@ -284,29 +488,71 @@ class HybridAgent:
             ValueError: If recipe loading fails
         """
         try:
-            if not parse_html:
-                html = scrape_raw_html(url)
-                recipe_text = html
-            else:
-                ingredients, directions = scrape_recipe(url)
-                recipe_text = format_recipe_for_llm(url, ingredients, directions)
+            recipe_text = fetch_recipe_text(url, parse_html)
 
             # Create deps with just current_step for loading
             deps = Deps(current_step=0)
 
-            result = self.agent.run_sync(
-                f"Please parse this recipe and extract all information:\n\n{recipe_text}",
-                deps=deps,
-                output_type=Recipe,
-            )
+            prompt = _parse_prompt(recipe_text)
+            try:
+                recipe = self.agent.run_sync(prompt, deps=deps, output_type=Recipe).output
+            except UnexpectedModelBehavior:
+                # Structured output kept failing validation; take a plain object and validate it once here
+                data = self.agent.run_sync(prompt, deps=deps, output_type=dict[str, Any]).output
+                recipe = Recipe.model_validate(data)
 
-            self.current_recipe = result.output
-            self.current_step = 0
-            return result.output
+            self._set_recipe(recipe)
+            return recipe
 
         except Exception as e:
             raise ValueError(f"Failed to load recipe: {e}") from e
 
+    async def load_recipe_async(self, url: str, parse_html: bool = False, recipe_text: str | None = None) -> Recipe:
+        """Async version of `load_recipe`.
+
+        The scrape runs in a worker thread while the event loop stays free,
+        and the parsing call awaits the model instead of blocking.
+
+        Args:
+            url: The URL of the recipe to load
+            parse_html: If True, parse HTML to extract structured recipe data.
+                       If False, pass raw HTML to the agent.
+            recipe_text: The result of `fetch_recipe_text(url, parse_html)` if it was already
+                        fetched, e.g. while the assistant was starting up
+
+        Returns:
+            Recipe: The loaded recipe
+
+        Raises:
+            ValueError: If recipe loading fails
+        """
+        try:
+            if recipe_text is None:
+                recipe_text = await asyncio.to_thread(fetch_recipe_text, url, parse_html)
+            prompt = _parse_prompt(recipe_text)
+            deps = Deps(current_step=0)
+            try:
+                recipe = (await self.agent.run(prompt, deps=deps, output_type=Recipe)).output
+            except UnexpectedModelBehavior:
+                # Structured output kept failing validation; take a plain object and validate it once here
+                data = (await self.agent.run(prompt, deps=deps, output_type=dict[str, Any])).output
+                recipe = Recipe.model_validate(data)
+
+            self._set_recipe(recipe)
+            return recipe
+
+        except Exception as e:
+            raise ValueError(f"Failed to load recipe: {e}") from e
+
+    def _set_recipe(self, recipe: Recipe) -> None:
+        """Make `recipe` current and rebuild the per-recipe caches."""
+        self.current_recipe = recipe
+        self.current_step = 0
+        self._recipe_json = None
+        steps = recipe.steps
+        self._step_responses = [_format_step(i, step, len(steps)) for i, step in enumerate(steps, 1)]
+        self._response_cache.clear()
+
     def ask(self, question: str) -> str:
         """Ask a question about the current recipe.
 
@@ -317,37 +563,168 @@ class HybridAgent:
             question: The user's question or command
 
         Returns:
-            str: The agent's response text
+            str: The agent's response text. Videos found along the way are
+                 available in `last_videos`.
         """
+        self.last_videos = []
         if not self.current_recipe:
             return "No recipe loaded. Please provide a recipe URL first."
 
-        # Get recipe as JSON string
-        recipe_json = self._get_recipe_context()
+        fast_response = self._answer_locally(question)
+        if fast_response is not None:
+            return fast_response
+
+        cache_key = self._cache_key(question)
+        if (cached := self._cached_response(cache_key)) is not None:
+            return cached
 
         # Create deps with only current step (mutable state)
-        deps = Deps(current_step=self.current_step)
+        deps = Deps(current_step=self.current_step, step_responses=self._step_responses)
 
         try:
             # Use instructions parameter to pass recipe JSON
-            result = self.agent.run_sync(
+            result = self._agent_for(question).run_sync(
                 question,
                 deps=deps,
-                instructions=f"Current Recipe (JSON):\n```json\n{recipe_json}\n```",
+                instructions=self._recipe_instructions(),
+                model_settings=ASK_MODEL_SETTINGS,
             )
 
             # Update current_step in case navigation tool was used
             self.current_step = deps.current_step
 
+            messages = result.new_messages()
+            self.last_videos = _collect_videos(messages)
+            if not _used_tools(messages):
+                self._store_response(cache_key, result.output)
             return result.output
 
         except Exception as e:
-            error_msg = str(e)
-            if hasattr(e, "__cause__") and e.__cause__:
-                error_msg += f"\nCause: {e.__cause__}"
-            return f"Error generating response: {error_msg}"
+            return f"Error generating response: {_describe_error(e)}"
+
+    async def ask_stream(self, question: str) -> AsyncIterator[str]:
+        """Ask a question about the current recipe, yielding the response as it is generated.
+
+        Same behavior as `ask`, but text deltas are yielded as soon as the model
+        produces them so a frontend can render the answer incrementally.
+
+        Args:
+            question: The user's question or command
+
+        Yields:
+            str: Chunks of the agent's response text
+        """
+        self.last_videos = []
+        if not self.current_recipe:
+            yield "No recipe loaded. Please provide a recipe URL first."
+            return
+
+        fast_response = self._answer_locally(question)
+        if fast_response is not None:
+            yield fast_response
+            return
+
+        cache_key = self._cache_key(question)
+        if (cached := self._cached_response(cache_key)) is not None:
+            yield cached
+            return
+
+        deps = Deps(current_step=self.current_step, step_responses=self._step_responses)
+
+        try:
+            # Drive the whole graph with iter() rather than run_stream(): run_stream stops at the first
+            # text part, so tool calls the model sends alongside its text (navigation, video search) would
+            # never run
+            agent = self._agent_for(question)
+            chunks = []
+            async with agent.iter(
+                question,
+                deps=deps,
+                instructions=self._recipe_instructions(),
+                model_settings=ASK_MODEL_SETTINGS,
+            ) as run:
+                async for node in run:
+                    if not Agent.is_model_request_node(node):
+                        continue
+                    async with node.stream(run.ctx) as events:
+                        async for event in events:
+                            if (chunk := _text_delta(event)) is not None:
+                                chunks.append(chunk)
+                                yield chunk
+
+            # Update current_step in case navigation tool was used
+            self.current_step = deps.current_step
+
+            messages = run.result.new_messages()
+            self.last_videos = _collect_videos(messages)
+            if not _used_tools(messages):
+                self._store_response(cache_key, "".join(chunks))
+
+        except Exception as e:
+            yield f"Error generating response: {_describe_error(e)}"
+
+    def _cache_key(self, question: str) -> bytes:
+        """Key a response by recipe, current step and normalized question."""
+        normalized = " ".join(question.lower().split())
+        raw = f"{self.current_recipe.url}|{self.current_step}|{normalized}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+    def _cached_response(self, key: bytes) -> str | None:
+        """Return a cached response and mark it as recently used."""
+        response = self._response_cache.get(key)
+        if response is not None:
+            self._response_cache.move_to_end(key)
+        return response
+
+    def _store_response(self, key: bytes, response: str) -> None:
+        """Cache a response, evicting the least recently used entry when full."""
+        self._response_cache[key] = response
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    def _recipe_instructions(self) -> str:
+        """Per-run instructions: the invariant recipe JSON first, the mutable step last.
+
+        Keeping everything that changes between turns at the end lets provider-side
+        prefix caching reuse the long recipe block.
+        """
+        return (
+            f"Current Recipe (JSON):\n```json\n{self._get_recipe_context()}\n```\n\ncurrent_step: {self.current_step}"
+        )
+
+    def _answer_locally(self, question: str) -> str | None:
+        """Answer deterministic navigation and display commands without the LLM.
+
+        Args:
+            question: The user's message
+
+        Returns:
+            str | None: The response, or None if the message needs the agent
+        """
+        steps = self.current_recipe.steps
+        if match := _NAV_RE.match(question):
+            if not self._step_responses:
+                return None
+            action = match.lastgroup
+            step_number = int(match["goto"]) if action == "goto" else None
+            deps = Deps(current_step=self.current_step, step_responses=self._step_responses)
+            _navigate(deps, action, step_number)
+            self.current_step = deps.current_step
+            return _format_step_for_user(self.current_step, steps[self.current_step - 1], len(steps))
+
+        if match := _SHOW_RE.match(question):
+            if match["ingredients"]:
+                lines = [_format_ingredient(i) for i in self.current_recipe.ingredients]
+                return "Ingredients:\n" + "\n".join(lines)
+            return "\n\n".join(f"Step {i}: {step.description}" for i, step in enumerate(steps, 1))
+
+        return None
 
     def reset(self):
         """Reset conversation history and current recipe state."""
         self.current_recipe = None
         self.current_step = 0
+        self._recipe_json = None
+        self._step_responses = []
+        self._response_cache.clear()
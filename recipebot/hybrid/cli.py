@@ -1,18 +1,32 @@
 """CLI interface for Hybrid recipe assistant."""
 
+import asyncio
 import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Prompt
+from rich.spinner import Spinner
 
-from recipebot.hybrid.agent import HybridAgent
+if TYPE_CHECKING:
+    from recipebot.hybrid.agent import HybridAgent
+    from recipebot.search import SearchResult
 
 PRINT_USER = os.getenv("PRINT_USER_INPUT", "false").lower() in ("true", "1", "yes")
 
+# Inputs that end the session, compared against the lowercased input
+EXIT_COMMANDS = frozenset({"quit", "exit", "q"})
+URL_PREFIXES = ("http://", "https://")
+
+# Shown until the assistant's first output arrives
+THINKING = "[dim]Thinking…[/dim]"
+
 app = typer.Typer(invoke_without_command=True, context_settings={"help_option_names": ["-h", "--help"]})
 console = Console()
 
@@ -39,14 +53,56 @@ def print_error(message: str):
     console.print(f"[bold red]Error:[/bold red] {message}")
 
 
+def assistant_panel(message) -> Panel:
+    """Wrap an assistant response in its panel."""
+    return Panel(
+        message,
+        title="[bold green]Assistant[/bold green]",
+        border_style="green",
+    )
+
+
 def print_assistant(message: str):
     """Print assistant response."""
+    console.print(assistant_panel(message))
+
+
+async def stream_assistant(assistant: "HybridAgent", question: str, add_step_prefix: bool = False):
+    """Render the assistant response incrementally as chunks arrive.
+
+    Falls back to printing the complete response once when output is not a terminal.
+    """
+    if not console.is_terminal:
+        response = "".join([chunk async for chunk in assistant.ask_stream(question)])
+        if add_step_prefix:
+            response = f"Step {assistant.current_step}: \n {response}"
+        print_assistant(Markdown(response))
+        return
+
+    response = ""
+    # The spinner shows until the first chunk replaces it
+    with Live(Spinner("dots", THINKING), console=console, refresh_per_second=12, vertical_overflow="visible") as live:
+        async for chunk in assistant.ask_stream(question):
+            response += chunk
+            live.update(assistant_panel(Markdown(response)))
+        # print current step as prefix of the response
+        if add_step_prefix:
+            response = f"Step {assistant.current_step}: \n {response}"
+        live.update(assistant_panel(Markdown(response)))
+
+
+def print_videos(videos: list["SearchResult"]):
+    """Print the videos the assistant found below its reply."""
+    if not videos:
+        return
+    lines = []
+    for video in videos:
+        line = f"- {video.title} - {video.url}"
+        if video.duration:
+            line += f" ({round(video.duration / 60)} min)"
+        lines.append(line)
     console.print(
-        Panel(
-            message,
-            title="[bold green]Assistant[/bold green]",
-            border_style="green",
-        )
+        Panel(Markdown("\n".join(lines)), title="[bold magenta]Videos[/bold magenta]", border_style="magenta")
     )
 
 
@@ -55,21 +111,70 @@ def print_user(message: str):
     console.print(f"[bold blue]You:[/bold blue] {message}")
 
 
-def main(pass_msg_history: bool = False, parse_html: bool = False, add_step_prefix: bool = False):
+def create_assistant() -> "HybridAgent":
+    """Import the agent module and create the assistant."""
+    # Deferred so `--help` doesn't load pydantic_ai and the model SDKs
+    from recipebot.hybrid.agent import HybridAgent
+
+    return HybridAgent()
+
+
+def start_assistant() -> "Future[HybridAgent]":
+    """Create the assistant in a background thread.
+
+    Importing pydantic_ai and the model SDKs takes a while, so this overlaps it with the user
+    typing their first input.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recipebot-init")
+    future = executor.submit(create_assistant)
+    executor.shutdown(wait=False)
+    return future
+
+
+def start_recipe_fetch(url: str, parse_html: bool) -> "Future[str]":
+    """Download and render a recipe in a background thread.
+
+    Used for a URL entered before the assistant is ready, so the download overlaps with the rest
+    of its startup.
+    """
+    # Only pulls in the scrapers, so it doesn't wait on the agent import running in the background
+    from recipebot.llm.agent import fetch_recipe_text
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recipebot-fetch")
+    future = executor.submit(fetch_recipe_text, url, parse_html)
+    executor.shutdown(wait=False)
+    return future
+
+
+def wait_for_assistant(future: "Future[HybridAgent]") -> "HybridAgent":
+    """Return the assistant once created, exiting if it could not be."""
+    try:
+        return future.result()
+    except Exception as e:
+        # Whatever the SDK raises (e.g. for a missing API key), the session cannot continue
+        print_error(str(e))
+        console.print("\n[dim]Make sure GOOGLE_API_KEY is set in .env[/dim]")
+        sys.exit(1)
+
+
+def main(pass_msg_history: bool = False, parse_html: bool = False, add_step_prefix: bool = False, stream: bool = True):
     """Start interactive chat with hybrid recipe assistant.
 
     Args:
         parse_html: If True, parse HTML to extract structured recipe data.
                    If False, pass raw HTML to the agent.
+        stream: If True, render responses token by token as they are generated.
     """
     print_welcome()
 
-    try:
-        assistant = HybridAgent()
-    except ValueError as e:
-        print_error(str(e))
-        console.print("\n[dim]Make sure GEMINI_API_KEY is set in .env[/dim]")
-        sys.exit(1)
+    pending_assistant = start_assistant()
+    assistant = None
+    pending_recipe_text: Future[str] | None = None
+
+    # One loop for the whole session so the model client's connections stay usable;
+    # pydantic_ai's run_sync picks up the same loop.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
 
     console.print("\n[dim]Ready! Provide a recipe URL or ask a question.[/dim]\n")
 
@@ -81,20 +186,32 @@ def main(pass_msg_history: bool = False, parse_html: bool = False, add_step_pref
                 continue
 
             # Handle special commands
-            if user_input.lower() in ["quit", "exit", "q"]:
+            command = user_input.lower()
+            if command in EXIT_COMMANDS:
                 console.print("\n[bold cyan]Goodbye! Happy cooking! 👨‍🍳[/bold cyan]\n")
                 break
 
-            if user_input.lower() == "reset":
+            if assistant is None:
+                if command.startswith(URL_PREFIXES):
+                    # The first recipe downloads while the assistant is still starting up
+                    pending_recipe_text = start_recipe_fetch(user_input, parse_html)
+                assistant = wait_for_assistant(pending_assistant)
+
+            if command == "reset":
                 assistant.reset()
                 console.print("[dim]Conversation reset. Ready for a new recipe![/dim]")
                 continue
 
             # Check if input looks like a URL
-            if user_input.startswith("http://") or user_input.startswith("https://"):
+            if command.startswith(URL_PREFIXES):
                 console.print(f"[dim]Loading recipe from: {user_input}[/dim]")
+                prefetched, pending_recipe_text = pending_recipe_text, None
                 try:
-                    recipe_state = assistant.load_recipe(user_input, parse_html=parse_html)
+                    with console.status("[dim]Loading recipe…[/dim]"):
+                        recipe_text = prefetched.result() if prefetched is not None else None
+                        recipe_state = loop.run_until_complete(
+                            assistant.load_recipe_async(user_input, parse_html=parse_html, recipe_text=recipe_text)
+                        )
                     response = (
                         f"Recipe loaded successfully!\n\n"
                         f"**{recipe_state.title}**\n\n"
@@ -113,12 +230,19 @@ def main(pass_msg_history: bool = False, parse_html: bool = False, add_step_pref
                 if PRINT_USER:
                     print_user(user_input)
 
-                response = assistant.ask(user_input)
+                if stream:
+                    loop.run_until_complete(stream_assistant(assistant, user_input, add_step_prefix))
+                    print_videos(assistant.last_videos)
+                    continue
+
+                with console.status(THINKING):
+                    response = assistant.ask(user_input)
                 # print current step as prefix of the response
                 if add_step_prefix:
                     response = f"Step {assistant.current_step}: \n {response}"
                 markdown = Markdown(response)
                 print_assistant(markdown)
+                print_videos(assistant.last_videos)
 
         except KeyboardInterrupt:
             console.print("\n\n[bold cyan]Goodbye! Happy cooking! 👨‍🍳[/bold cyan]\n")
@@ -131,26 +255,28 @@ def main(pass_msg_history: bool = False, parse_html: bool = False, add_step_pref
 
 
 @app.callback(invoke_without_command=True)
-def main_callback(ctx: typer.Context, parse_html: bool = True):
+def main_callback(ctx: typer.Context, parse_html: bool = True, stream: bool = True):
     """Recipe Assistant - Hybrid-Powered.
 
     Args:
         ctx: Typer context.
         parse_html: If True, parse HTML to extract structured recipe data.
+        stream: If True, render responses as they are generated.
     """
     if ctx.invoked_subcommand is None:
-        main(parse_html=parse_html)
+        main(parse_html=parse_html, stream=stream)
 
 
 @app.command()
-def chat(parse_html: bool = True):
+def chat(parse_html: bool = True, stream: bool = True):
     """Start interactive chat with hybrid recipe assistant.
 
     Args:
         parse_html: If True, parse HTML to extract structured recipe data.
                    If False, pass raw HTML to the agent.
+        stream: If True, render responses as they are generated.
     """
-    main(parse_html=parse_html)
+    main(parse_html=parse_html, stream=stream)
 
 
 if __name__ == "__main__":
@@ -1,29 +1,72 @@
 """LLM-only recipe assistant using Google Gemini 2.5 Flash Lite."""
 
+import hashlib
+import json
 import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-import google.generativeai as genai
 from dotenv import load_dotenv
 
-from recipebot.crawler import extract_title_from_url, scrape_recipe
+from recipebot.crawler import extract_title_from_url, scrape_raw_html, scrape_recipe
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # Load environment variables
 load_dotenv(".env")
 
-# Configure Gemini API
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
+
+# With `chat_cache` on, chat histories are kept here so reloading a recipe doesn't resend it to the model
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "recipebot" / "chats"
+
+_genai = None
+
+
+def _get_genai():
+    """Import and configure the Gemini SDK on first use.
+
+    The SDK takes hundreds of milliseconds to import, so it is only loaded once an
+    assistant is actually created (not for `--help` or when only formatting helpers are used).
+    """
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai
+
+        if GEMINI_API_KEY:
+            genai.configure(api_key=GEMINI_API_KEY)
+        _genai = genai
+    return _genai
+
+
+# Sampling settings shared by every Gemini call in the chat session
+GENERATION_CONFIG = {
+    "temperature": 0.7,
+    "top_p": 0.8,
+    "top_k": 40,
+}
+
+
+def _good_finish_reasons() -> tuple:
+    """Finish reasons after which a streamed answer can stay in the chat history."""
+    reason = _get_genai().protos.Candidate.FinishReason
+    return (reason.FINISH_REASON_UNSPECIFIED, reason.STOP, reason.MAX_TOKENS)
+
+
+# Semantic answer cache: questions whose embeddings are this similar reuse the earlier answer
+EMBEDDING_MODEL = "models/text-embedding-004"
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_SIZE = 128
 
 
 def format_recipe_for_llm(url: str, ingredients: list, directions: list[str]) -> str:
     """Format recipe data as text for LLM context."""
     title = extract_title_from_url(url)
 
-    recipe_text = f"RECIPE: {title}\n"
-    recipe_text += f"URL: {url}\n\n"
-
-    recipe_text += "INGREDIENTS:\n"
+    # Collect pieces and join once instead of growing a string with +=
+    lines = [f"RECIPE: {title}", f"URL: {url}", "", "INGREDIENTS:"]
     for i, ing in enumerate(ingredients, 1):
         parts = []
         if ing.quantity:
@@ -37,13 +80,31 @@ def format_recipe_for_llm(url: str, ingredients: list, directions: list[str]) ->
         if ing.misc:
             parts.append(ing.misc)
 
-        recipe_text += f"{i}. {' '.join(parts)}\n"
+        lines.append(f"{i}. {' '.join(parts)}")
+
+    lines.append("")
+    lines.append("DIRECTIONS:")
+    lines.extend(f"{i}. {direction}" for i, direction in enumerate(directions, 1))
+    lines.append("")
+
+    return "\n".join(lines)
+
 
-    recipe_text += "\nDIRECTIONS:\n"
-    for i, direction in enumerate(directions, 1):
-        recipe_text += f"{i}. {direction}\n"
+def fetch_recipe_text(url: str, parse_html: bool = False) -> str:
+    """Fetch a recipe and render it as the text the hybrid agent parses.
 
-    return recipe_text
+    Args:
+        url: The URL of the recipe to fetch
+        parse_html: If True, parse HTML and format the structured recipe.
+                   If False, return the raw HTML.
+
+    Returns:
+        str: Recipe text for the parsing prompt
+    """
+    if not parse_html:
+        return scrape_raw_html(url)
+    ingredients, directions = scrape_recipe(url)
+    return format_recipe_for_llm(url, ingredients, directions)
 
 
 SYSTEM_PROMPT = """You are a knowledgeable and friendly culinary assistant designed to help users understand and follow recipes. Your primary role is to interpret recipe information, answer questions, and guide users through the cooking process.
@@ -130,11 +191,22 @@ Remember: Your goal is to make cooking accessible and enjoyable. Be patient, cle
 class RecipeAssistant:
     """LLM-only recipe assistant using Gemini 2.5 Flash Lite."""
 
-    def __init__(self):
-        """Initialize the assistant with Gemini model."""
+    def __init__(self, semantic_cache: bool = False, chat_cache: bool = False):
+        """Initialize the assistant with Gemini model.
+
+        Args:
+            semantic_cache: Answer questions that are near-duplicates of earlier ones (by embedding
+                similarity) from memory instead of calling the model. Off by default because
+                step-relative questions like "what's next?" recur with different answers.
+            chat_cache: Keep the recipe-loading turn of each chat under `CACHE_DIR` and resume it
+                when the same page is loaded again. Off by default so nothing is written to disk
+                unless asked for.
+        """
         if not GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY not found in environment variables")
 
+        genai = _get_genai()
+
         # Initialize Gemini model - try gemini-2.5-flash-lite first, then fallbacks
         model_names = [
             "gemini-2.5-flash-lite",
@@ -146,6 +218,7 @@ class RecipeAssistant:
         for model_name in model_names:
             try:
                 self.model = genai.GenerativeModel(model_name=model_name, system_instruction=SYSTEM_PROMPT)
+                self.model_name = model_name
                 # Test if model works by checking if it's accessible
                 break
             except Exception:
@@ -159,8 +232,18 @@ class RecipeAssistant:
         self.current_recipe: str | None = None
         self.current_recipe_text: str | None = None
 
+        self.semantic_cache = semantic_cache
+        self.chat_cache = chat_cache
+        self._qcache: list[tuple[np.ndarray, str]] = []
+        self._qmatrix: np.ndarray | None = None
+
     def load_recipe(self, url: str) -> str:
-        """Load a recipe from URL and return formatted text."""
+        """Load a recipe from URL and return formatted text.
+
+        With `chat_cache` on, a chat previously started for the same page content and model is
+        resumed from disk, which skips the recipe-loading turn.
+        """
+        self._clear_semantic_cache()
         try:
             ingredients, directions = scrape_recipe(url)
             if not ingredients or not directions:
@@ -170,49 +253,141 @@ class RecipeAssistant:
             self.current_recipe = url
             self.current_recipe_text = recipe_text
 
+            history = self._load_history() if self.chat_cache else None
+            if history is not None:
+                self.chat = self.model.start_chat(history=history)
+                return f"Recipe loaded successfully!\n\n{history[-1]['parts'][0]}"
+
             # Start new chat session with recipe context
             self.chat = self.model.start_chat(history=[])
 
             # Send recipe context to the model
             prompt = f"Please load this recipe:\n\n{recipe_text}"
-            response = self.chat.send_message(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.7,
-                    top_p=0.8,
-                    top_k=40,
-                ),
-            )
+            response = self.chat.send_message(prompt, generation_config=GENERATION_CONFIG)
 
             acknowledgment = response.text
+            if self.chat_cache:
+                self._save_history()
             return f"Recipe loaded successfully!\n\n{acknowledgment}"
 
         except Exception as e:
             raise ValueError(f"Failed to load recipe: {e}") from e
 
+    def _history_path(self) -> Path:
+        """Return the cache file for the chat about the current recipe with the current model.
+
+        The key covers the scraped recipe text as well as the URL, so an edited page starts a new chat.
+        """
+        key = hashlib.blake2b(digest_size=16)
+        for part in (self.model_name, self.current_recipe, self.current_recipe_text):
+            key.update(part.encode())
+            key.update(b"\0")
+        return CACHE_DIR / f"{key.hexdigest()}.json"
+
+    def _load_history(self) -> list[dict] | None:
+        """Read the cached chat for the current recipe, or return None if there is no usable one."""
+        try:
+            cached = json.loads(self._history_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return cached.get("history") or None
+
+    def _save_history(self):
+        """Write the recipe-loading turn of the current chat to the cache.
+
+        Failures are ignored; the cache only saves a request on the next start.
+        """
+        history = [{"role": m.role, "parts": [p.text for p in m.parts]} for m in self.chat.history]
+        path = self._history_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({"history": history}), encoding="utf-8")
+        except OSError:
+            pass
+
     def ask(self, question: str) -> str:
         """Ask a question about the current recipe."""
+        return "".join(self.ask_stream(question))
+
+    def ask_stream(self, question: str) -> Iterator[str]:
+        """Ask a question about the current recipe, yielding text as Gemini generates it."""
         if not self.current_recipe_text or not self.chat:
-            return "No recipe loaded. Please provide a recipe URL first."
+            yield "No recipe loaded. Please provide a recipe URL first."
+            return
+
+        vector = self._embed(question) if self.semantic_cache else None
+        if vector is not None:
+            cached = self._semantic_lookup(vector)
+            if cached is not None:
+                yield cached
+                return
 
         # Generate response using chat session (maintains history automatically)
+        chunks = []
+        response = None
         try:
-            response = self.chat.send_message(
-                question,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.7,
-                    top_p=0.8,
-                    top_k=40,
-                ),
-            )
-
-            return response.text
+            response = self.chat.send_message(question, stream=True, generation_config=GENERATION_CONFIG)
+            for chunk in response:
+                # The final chunk may only carry the finish reason
+                if chunk.parts:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+            finish_reason = response.candidates[0].finish_reason if response.candidates else None
+            if finish_reason not in _good_finish_reasons():
+                raise RuntimeError(f"response stopped early ({getattr(finish_reason, 'name', finish_reason)})")
 
         except Exception as e:
-            return f"Error generating response: {e}"
+            # A broken streamed turn would make every later send_message raise BrokenResponseError
+            if response is not None:
+                self.chat.rewind()
+            yield f"Error generating response: {e}"
+            return
+
+        if vector is not None:
+            self._semantic_store(vector, "".join(chunks))
+
+    def _embed(self, text: str) -> "np.ndarray | None":
+        """Return the unit-normalized embedding of `text`, or None if embedding fails."""
+        # Only the opt-in semantic cache needs numpy
+        import numpy as np
+
+        try:
+            result = _get_genai().embed_content(model=EMBEDDING_MODEL, content=text, task_type="semantic_similarity")
+        except Exception:
+            return None
+        vector = np.asarray(result["embedding"], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def _semantic_lookup(self, vector: "np.ndarray") -> str | None:
+        """Return the cached answer whose question is most similar to `vector`, if above the threshold."""
+        import numpy as np
+
+        if not self._qcache:
+            return None
+        if self._qmatrix is None:
+            self._qmatrix = np.stack([v for v, _ in self._qcache])
+        scores = self._qmatrix @ vector
+        best = int(scores.argmax())
+        return self._qcache[best][1] if scores[best] >= SEMANTIC_CACHE_THRESHOLD else None
+
+    def _semantic_store(self, vector: "np.ndarray", answer: str):
+        """Cache `answer` for a question embedding, evicting the oldest entry when full."""
+        if len(self._qcache) >= SEMANTIC_CACHE_SIZE:
+            self._qcache.pop(0)
+        self._qcache.append((vector, answer))
+        self._qmatrix = None
+
+    def _clear_semantic_cache(self):
+        """Drop all cached answers (they belong to the previous recipe)."""
+        self._qcache.clear()
+        self._qmatrix = None
 
     def reset(self):
         """Reset conversation history and current recipe."""
+        if self.chat_cache and self.current_recipe_text:
+            self._history_path().unlink(missing_ok=True)
+        self._clear_semantic_cache()
         self.chat = None
         self.current_recipe = None
         self.current_recipe_text = None
@@ -1,17 +1,30 @@
 """CLI interface for LLM-only recipe assistant."""
 
 import sys
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Prompt
+from rich.spinner import Spinner
 
-from recipebot.llm.agent import RecipeAssistant
+if TYPE_CHECKING:
+    from recipebot.llm.agent import RecipeAssistant
 
 PRINT_USER = False
 
+# Inputs that end the session, compared against the lowercased input
+EXIT_COMMANDS = frozenset({"quit", "exit", "q"})
+URL_PREFIXES = ("http://", "https://")
+
+# Shown until the assistant's first output arrives
+THINKING = "[dim]Thinking…[/dim]"
+
 app = typer.Typer(invoke_without_command=True)
 console = Console()
 
@@ -39,15 +52,35 @@ def print_error(message: str):
     console.print(f"[bold red]Error:[/bold red] {message}")
 
 
+def assistant_panel(message) -> Panel:
+    """Wrap an assistant response in its panel."""
+    return Panel(
+        message,
+        title="[bold green]Assistant[/bold green]",
+        border_style="green",
+    )
+
+
 def print_assistant(message: str):
     """Print assistant response."""
-    console.print(
-        Panel(
-            message,
-            title="[bold green]Assistant[/bold green]",
-            border_style="green",
-        )
-    )
+    console.print(assistant_panel(message))
+
+
+def stream_assistant(chunks: Iterable[str]):
+    """Render the assistant response incrementally as chunks arrive.
+
+    Falls back to printing the complete response once when output is not a terminal.
+    """
+    if not console.is_terminal:
+        print_assistant(Markdown("".join(chunks)))
+        return
+
+    response = ""
+    # The spinner shows until the first chunk replaces it
+    with Live(Spinner("dots", THINKING), console=console, refresh_per_second=12, vertical_overflow="visible") as live:
+        for chunk in chunks:
+            response += chunk
+            live.update(assistant_panel(Markdown(response)))
 
 
 def print_user(message: str):
@@ -55,17 +88,48 @@ def print_user(message: str):
     console.print(f"[bold blue]You:[/bold blue] {message}")
 
 
-def main():
-    """Start interactive chat with recipe assistant."""
-    print_welcome()
+def create_assistant(semantic_cache: bool = False, chat_cache: bool = False) -> "RecipeAssistant":
+    """Import the agent module and create the assistant."""
+    # Deferred so `--help` doesn't load the agent and its dependencies
+    from recipebot.llm.agent import RecipeAssistant
+
+    return RecipeAssistant(semantic_cache=semantic_cache, chat_cache=chat_cache)
+
+
+def start_assistant(semantic_cache: bool = False, chat_cache: bool = False) -> "Future[RecipeAssistant]":
+    """Create the assistant in a background thread.
 
+    Importing the Gemini SDK takes a while, so this overlaps it with the user typing their first input.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recipebot-init")
+    future = executor.submit(create_assistant, semantic_cache, chat_cache)
+    executor.shutdown(wait=False)
+    return future
+
+
+def wait_for_assistant(future: "Future[RecipeAssistant]") -> "RecipeAssistant":
+    """Return the assistant once created, exiting if it could not be."""
     try:
-        assistant = RecipeAssistant()
-    except ValueError as e:
+        return future.result()
+    except Exception as e:
+        # Whatever the SDK raises (e.g. for a missing API key), the session cannot continue
         print_error(str(e))
         console.print("\n[dim]Make sure GEMINI_API_KEY is set in .env[/dim]")
         sys.exit(1)
 
+
+def main(semantic_cache: bool = False, chat_cache: bool = False):
+    """Start interactive chat with recipe assistant.
+
+    Args:
+        semantic_cache: If True, reuse answers for questions similar to earlier ones.
+        chat_cache: If True, keep recipe chats on disk and resume them when a page is reloaded.
+    """
+    print_welcome()
+
+    pending_assistant = start_assistant(semantic_cache, chat_cache)
+    assistant = None
+
     console.print("\n[dim]Ready! Provide a recipe URL or ask a question.[/dim]\n")
 
     while True:
@@ -76,20 +140,25 @@ def main():
                 continue
 
             # Handle special commands
-            if user_input.lower() in ["quit", "exit", "q"]:
+            command = user_input.lower()
+            if command in EXIT_COMMANDS:
                 console.print("\n[bold cyan]Goodbye! Happy cooking! 👨‍🍳[/bold cyan]\n")
                 break
 
-            if user_input.lower() == "reset":
+            if assistant is None:
+                assistant = wait_for_assistant(pending_assistant)
+
+            if command == "reset":
                 assistant.reset()
                 console.print("[dim]Conversation reset. Ready for a new recipe![/dim]")
                 continue
 
             # Check if input looks like a URL
-            if user_input.startswith("http://") or user_input.startswith("https://"):
+            if command.startswith(URL_PREFIXES):
                 console.print(f"[dim]Loading recipe from: {user_input}[/dim]")
                 try:
-                    response = assistant.load_recipe(user_input)
+                    with console.status("[dim]Loading recipe…[/dim]"):
+                        response = assistant.load_recipe(user_input)
                     print_assistant(response)
                 except Exception as e:
                     print_error(f"Failed to load recipe: {e}")
@@ -100,10 +169,7 @@ def main():
                     continue
                 if PRINT_USER:
                     print_user(user_input)
-                response = assistant.ask(user_input)
-
-                markdown = Markdown(response)
-                print_assistant(markdown)
+                stream_assistant(assistant.ask_stream(user_input))
 
         except KeyboardInterrupt:
             console.print("\n\n[bold cyan]Goodbye! Happy cooking! 👨‍🍳[/bold cyan]\n")
@@ -116,16 +182,27 @@ def main():
 
 
 @app.callback(invoke_without_command=True)
-def main_callback(ctx: typer.Context):
-    """Recipe Assistant - LLM-Powered."""
+def main_callback(ctx: typer.Context, semantic_cache: bool = False, chat_cache: bool = False):
+    """Recipe Assistant - LLM-Powered.
+
+    Args:
+        ctx: Typer context.
+        semantic_cache: If True, reuse answers for questions similar to earlier ones.
+        chat_cache: If True, keep recipe chats on disk and resume them when a page is reloaded.
+    """
     if ctx.invoked_subcommand is None:
-        main()
+        main(semantic_cache=semantic_cache, chat_cache=chat_cache)
 
 
 @app.command()
-def chat():
-    """Start interactive chat with recipe assistant."""
-    main()
+def chat(semantic_cache: bool = False, chat_cache: bool = False):
+    """Start interactive chat with recipe assistant.
+
+    Args:
+        semantic_cache: If True, reuse answers for questions similar to earlier ones.
+        chat_cache: If True, keep recipe chats on disk and resume them when a page is reloaded.
+    """
+    main(semantic_cache=semantic_cache, chat_cache=chat_cache)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,67 @@
+from dataclasses import dataclass, field
 from typing import Literal
 
+from pydantic import VERSION as PYDANTIC_VERSION
 from pydantic import BaseModel, Field
 
+# Ingredient and Step are created in bulk by the scrapers and step parser and then only read,
+# so they are plain slotted dataclasses. pydantic still validates them when they are nested in
+# a Recipe, and takes the field descriptions for the LLM schema from the attribute docstrings.
+_DATACLASS_PYDANTIC_CONFIG = {"use_attribute_docstrings": True}
+# pydantic v1 (pinned by the rasa extra) validates nested dataclasses through __dict__
+_SLOTS = not PYDANTIC_VERSION.startswith("1.")
 
-class Ingredient(BaseModel):
-    name: str | None = Field(default=None, description="The name of the ingredient")
-    quantity: str | None = Field(default=None, description="The quantity of the ingredient")
-    unit: str | None = Field(default=None, description="The unit of the ingredient")
-    preparation: str | None = Field(default=None, description="The preparation of the ingredient")
-    misc: str | None = Field(default=None, description="The additional information of the ingredient")
+
+@dataclass(slots=_SLOTS)
+class Ingredient:
+    __pydantic_config__ = _DATACLASS_PYDANTIC_CONFIG
+
+    name: str | None = None
+    """The name of the ingredient"""
+    quantity: str | None = None
+    """The quantity of the ingredient"""
+    unit: str | None = None
+    """The unit of the ingredient"""
+    preparation: str | None = None
+    """The preparation of the ingredient"""
+    misc: str | None = None
+    """The additional information of the ingredient"""
+
+
+@dataclass(slots=_SLOTS)
+class StepTime:
+    __pydantic_config__ = _DATACLASS_PYDANTIC_CONFIG
+
+    duration: str | int | float | None = None
+    """The duration of the step, or a description (e.g. "until golden") when qualitative"""
+    duration_min: int | float | None = None
+    """The lower bound of a duration range"""
+    duration_max: int | float | None = None
+    """The upper bound of a duration range"""
+    unit: str | None = None
+    """The unit of the duration (singular, e.g. "minute")"""
+    type: Literal["qualitative"] | None = None
+    """Set when the duration is a description rather than a number"""
+
+    def __bool__(self) -> bool:
+        """Whether any time information was found."""
+        return any(
+            value is not None for value in (self.duration, self.duration_min, self.duration_max, self.unit, self.type)
+        )
+
+
+@dataclass(slots=_SLOTS)
+class StepTemperature:
+    __pydantic_config__ = _DATACLASS_PYDANTIC_CONFIG
+
+    oven: str | None = None
+    """The oven temperature (e.g. "350°F")"""
+    heat: str | None = None
+    """The stovetop heat level (e.g. "medium heat")"""
+
+    def __bool__(self) -> bool:
+        """Whether any temperature information was found."""
+        return self.oven is not None or self.heat is not None
 
 
 # {
@@ -18,28 +71,40 @@ class Ingredient(BaseModel):
 #     "tools": [list of tools],
 #     "methods": [list of methods],
 #     "time": {
-#         "duration": str or dict of sub-times,
+#         "duration": str or number (or "duration_min"/"duration_max" for a range),
+#         "unit": str (optional),
 #     },
 #     "temperature": {
 #         "oven": str (optional),
-#         "<ingredient>": str (optional)
+#         "heat": str (optional)
 #     }
 # }
 
 
-class Step(BaseModel):
-    step_number: int = Field(..., description="The step number")
-    description: str = Field(..., description="The description of the step")
-    ingredients: list[Ingredient] = Field(default_factory=list, description="The ingredients used in the step")
-    tools: list[str] = Field(default_factory=list, description="The tools used in the step")
-    methods: list[str] = Field(default_factory=list, description="The methods used in the step")
-    time: dict[str, str | int] = Field(default_factory=dict, description="The time required for the step")
-    temperature: dict[str, str] = Field(default_factory=dict, description="The temperature required for the step")
-    actionable: bool = Field(default=True, description="Whether the method is actionable or advices")
-    is_prepared: bool = Field(default=False, description="Whether the step is use to prepare something for next step")
-    info_type: Literal["warning", "advice", "observation"] | None = Field(
-        default=None, description="The type of the step"
-    )
+@dataclass(slots=_SLOTS)
+class Step:
+    __pydantic_config__ = _DATACLASS_PYDANTIC_CONFIG
+
+    step_number: int
+    """The step number"""
+    description: str
+    """The description of the step"""
+    ingredients: list[Ingredient] = field(default_factory=list)
+    """The ingredients used in the step"""
+    tools: list[str] = field(default_factory=list)
+    """The tools used in the step"""
+    methods: list[str] = field(default_factory=list)
+    """The methods used in the step"""
+    time: StepTime = field(default_factory=StepTime)
+    """The time required for the step"""
+    temperature: StepTemperature = field(default_factory=StepTemperature)
+    """The temperature required for the step"""
+    actionable: bool = True
+    """Whether the method is actionable or advices"""
+    is_prepared: bool = False
+    """Whether the step is use to prepare something for next step"""
+    info_type: Literal["warning", "advice", "observation"] | None = None
+    """The type of the step"""
 
 
 class Recipe(BaseModel):
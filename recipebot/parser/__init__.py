@@ -1,13 +1,17 @@
-from .methods import extract_methods_from_text
-from .recipe import parse_recipe, show_recipe
-from .step import parse_steps_from_directions
+from .methods import extract_methods_batch, extract_methods_from_text
+from .recipe import parse_recipe, parse_recipes, show_recipe, steps_table
+from .step import parse_steps_for_many_recipes, parse_steps_from_directions
 from .tools import extract_tools_from_text, get_tools_by_category
 
 __all__ = [
     "parse_recipe",
+    "parse_recipes",
     "show_recipe",
+    "steps_table",
     "parse_steps_from_directions",
+    "parse_steps_for_many_recipes",
     "extract_tools_from_text",
     "get_tools_by_category",
     "extract_methods_from_text",
+    "extract_methods_batch",
 ]
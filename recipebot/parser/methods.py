@@ -1,293 +1,470 @@
 """Cooking methods database and extraction utilities."""
 
-from spacy.matcher import PhraseMatcher
+import re
+import sys
+from collections.abc import Iterable
+from functools import lru_cache
+
+from spacy.language import Language
+from spacy.tokens import Doc
 
 from .spacy_utils import get_nlp
+from .text_utils import lower_text
+
+
+def _interned(words: Iterable[str]) -> frozenset[str]:
+    """Freeze a vocabulary of interned strings, so equal strings taken from it compare by identity."""
+    return frozenset(map(sys.intern, words))
+
 
 # Primary cooking methods (main techniques)
-PRIMARY_METHODS = {
-    # Heat-based cooking
-    "bake",
-    "baking",
-    "roast",
-    "roasting",
-    "broil",
-    "broiling",
-    "grill",
-    "grilling",
-    "fry",
-    "frying",
-    "deep fry",
-    "deep-fry",
-    "pan fry",
-    "pan-fry",
-    "sauté",
-    "saute",
-    "sautéing",
-    "sauteing",
-    "stir-fry",
-    "stir fry",
-    "stir-frying",
-    "boil",
-    "boiling",
-    "simmer",
-    "simmering",
-    "steam",
-    "steaming",
-    "poach",
-    "poaching",
-    "braise",
-    "braising",
-    "sear",
-    "searing",
-    "toast",
-    "toasting",
-    "blanch",
-    "blanching",
-    "caramelize",
-    "caramelizing",
-    # Other primary techniques
-    "smoke",
-    "smoking",
-    "cure",
-    "curing",
-    "marinate",
-    "marinating",
-    "ferment",
-    "fermenting",
-}
+PRIMARY_METHODS = _interned(
+    {
+        # Heat-based cooking
+        "bake",
+        "baking",
+        "roast",
+        "roasting",
+        "broil",
+        "broiling",
+        "grill",
+        "grilling",
+        "fry",
+        "frying",
+        "deep fry",
+        "deep-fry",
+        "pan fry",
+        "pan-fry",
+        "sauté",
+        "saute",
+        "sautéing",
+        "sauteing",
+        "stir-fry",
+        "stir fry",
+        "stir-frying",
+        "boil",
+        "boiling",
+        "simmer",
+        "simmering",
+        "steam",
+        "steaming",
+        "poach",
+        "poaching",
+        "braise",
+        "braising",
+        "sear",
+        "searing",
+        "toast",
+        "toasting",
+        "blanch",
+        "blanching",
+        "caramelize",
+        "caramelizing",
+        # Other primary techniques
+        "smoke",
+        "smoking",
+        "cure",
+        "curing",
+        "marinate",
+        "marinating",
+        "ferment",
+        "fermenting",
+    }
+)
 
 # Words to exclude from method extraction (adjectives, particles, etc.)
-METHOD_EXCLUDE_WORDS = {
-    "dry",
-    "wet",
-    "hot",
-    "cold",
-    "fresh",
-    "new",
-    "old",
-    "raw",
-    "cooked",
-    "large",
-    "small",
-    "medium",
-    "cream",  # Often part of "sour cream", "heavy cream" (ingredient, not method)
-    "hash",  # Part of "hash browns"
-    "sour",  # Part of "sour cream"
-}
+METHOD_EXCLUDE_WORDS = _interned(
+    {
+        "dry",
+        "wet",
+        "hot",
+        "cold",
+        "fresh",
+        "new",
+        "old",
+        "raw",
+        "cooked",
+        "large",
+        "small",
+        "medium",
+        "cream",  # Often part of "sour cream", "heavy cream" (ingredient, not method)
+        "hash",  # Part of "hash browns"
+        "sour",  # Part of "sour cream"
+    }
+)
 
 # Secondary/preparation methods (supplemental actions)
-SECONDARY_METHODS = {
-    # Cutting techniques
-    "chop",
-    "chopping",
-    "finely chop",
-    "roughly chop",
-    "coarsely chop",
-    "dice",
-    "dicing",
-    "finely dice",
-    "small dice",
-    "medium dice",
-    "large dice",
-    "mince",
-    "mincing",
-    "finely mince",
-    "slice",
-    "slicing",
-    "thinly slice",
-    "thickly slice",
-    "julienne",
-    "julienning",
-    "cube",
-    "cubing",
-    "cut",
-    "cutting",
-    "trim",
-    "trimming",
-    "halve",
-    "halving",
-    "quarter",
-    "quartering",
-    "shred",
-    "shredding",
-    "grate",
-    "grating",
-    "finely grate",
-    "coarsely grate",
-    "zest",
-    "zesting",
-    "peel",
-    "peeling",
-    "core",
-    "coring",
-    "pit",
-    "pitting",
-    "debone",
-    "deboning",
-    "skin",
-    "skinning",
-    # Mixing techniques
-    "mix",
-    "mixing",
-    "stir",
-    "stirring",
-    "whisk",
-    "whisking",
-    "beat",
-    "beating",
-    "whip",
-    "whipping",
-    "fold",
-    "folding",
-    "fold in",
-    "combine",
-    "combining",
-    "blend",
-    "blending",
-    "puree",
-    "pureeing",
-    "knead",
-    "kneading",
-    "toss",
-    "tossing",
-    # Other preparation
-    "season",
-    "seasoning",
-    "salt",
-    "salting",
-    "pepper",
-    "peppering",
-    "garnish",
-    "garnishing",
-    "coat",
-    "coating",
-    "dredge",
-    "dredging",
-    "bread",
-    "breading",
-    "baste",
-    "basting",
-    "glaze",
-    "glazing",
-    "brush",
-    "brushing",
-    "drizzle",
-    "drizzling",
-    "sprinkle",
-    "sprinkling",
-    "dust",
-    "dusting",
-    "pour",
-    "pouring",
-    "add",
-    "adding",
-    "incorporate",
-    "divide",
-    "dividing",
-    "separate",
-    "separating",
-    "strain",
-    "straining",
-    "drain",
-    "draining",
-    "rinse",
-    "rinsing",
-    "wash",
-    "washing",
-    "dry",
-    "drying",
-    "pat dry",
-    "squeeze",
-    "squeezing",
-    "press",
-    "pressing",
-    "crush",
-    "crushing",
-    "mash",
-    "mashing",
-    "grind",
-    "grinding",
-    "sift",
-    "sifting",
-    "roll",
-    "rolling",
-    "roll out",
-    "shape",
-    "shaping",
-    "form",
-    "forming",
-    "flatten",
-    "flattening",
-    "spread",
-    "spreading",
-    "layer",
-    "layering",
-    "arrange",
-    "arranging",
-    "transfer",
-    "transferring",
-    "remove",
-    "removing",
-    "discard",
-    "discarding",
-    "reserve",
-    "reserving",
-    "set aside",
-    "let stand",
-    "let sit",
-    "let rest",
-    "cool",
-    "cooling",
-    "chill",
-    "chilling",
-    "refrigerate",
-    "refrigerating",
-    "freeze",
-    "freezing",
-    "thaw",
-    "thawing",
-    "heat",
-    "heating",
-    "heat up",
-    "warm",
-    "warming",
-    "warm up",
-    "preheat",
-    "preheating",
-    "bring to a boil",
-    "bring to boil",
-    "bring to a simmer",
-    "reduce heat",
-    "reduce",
-    "reducing",
-    "increase heat",
-    "turn off",
-    "turn off heat",
-    "cover",
-    "covering",
-    "uncover",
-    "uncovering",
-}
+SECONDARY_METHODS = _interned(
+    {
+        # Cutting techniques
+        "chop",
+        "chopping",
+        "finely chop",
+        "roughly chop",
+        "coarsely chop",
+        "dice",
+        "dicing",
+        "finely dice",
+        "small dice",
+        "medium dice",
+        "large dice",
+        "mince",
+        "mincing",
+        "finely mince",
+        "slice",
+        "slicing",
+        "thinly slice",
+        "thickly slice",
+        "julienne",
+        "julienning",
+        "cube",
+        "cubing",
+        "cut",
+        "cutting",
+        "trim",
+        "trimming",
+        "halve",
+        "halving",
+        "quarter",
+        "quartering",
+        "shred",
+        "shredding",
+        "grate",
+        "grating",
+        "finely grate",
+        "coarsely grate",
+        "zest",
+        "zesting",
+        "peel",
+        "peeling",
+        "core",
+        "coring",
+        "pit",
+        "pitting",
+        "debone",
+        "deboning",
+        "skin",
+        "skinning",
+        # Mixing techniques
+        "mix",
+        "mixing",
+        "stir",
+        "stirring",
+        "whisk",
+        "whisking",
+        "beat",
+        "beating",
+        "whip",
+        "whipping",
+        "fold",
+        "folding",
+        "fold in",
+        "combine",
+        "combining",
+        "blend",
+        "blending",
+        "puree",
+        "pureeing",
+        "knead",
+        "kneading",
+        "toss",
+        "tossing",
+        # Other preparation
+        "season",
+        "seasoning",
+        "salt",
+        "salting",
+        "pepper",
+        "peppering",
+        "garnish",
+        "garnishing",
+        "coat",
+        "coating",
+        "dredge",
+        "dredging",
+        "bread",
+        "breading",
+        "baste",
+        "basting",
+        "glaze",
+        "glazing",
+        "brush",
+        "brushing",
+        "drizzle",
+        "drizzling",
+        "sprinkle",
+        "sprinkling",
+        "dust",
+        "dusting",
+        "pour",
+        "pouring",
+        "add",
+        "adding",
+        "incorporate",
+        "divide",
+        "dividing",
+        "separate",
+        "separating",
+        "strain",
+        "straining",
+        "drain",
+        "draining",
+        "rinse",
+        "rinsing",
+        "wash",
+        "washing",
+        "dry",
+        "drying",
+        "pat dry",
+        "squeeze",
+        "squeezing",
+        "press",
+        "pressing",
+        "crush",
+        "crushing",
+        "mash",
+        "mashing",
+        "grind",
+        "grinding",
+        "sift",
+        "sifting",
+        "roll",
+        "rolling",
+        "roll out",
+        "shape",
+        "shaping",
+        "form",
+        "forming",
+        "flatten",
+        "flattening",
+        "spread",
+        "spreading",
+        "layer",
+        "layering",
+        "arrange",
+        "arranging",
+        "transfer",
+        "transferring",
+        "remove",
+        "removing",
+        "discard",
+        "discarding",
+        "reserve",
+        "reserving",
+        "set aside",
+        "let stand",
+        "let sit",
+        "let rest",
+        "cool",
+        "cooling",
+        "chill",
+        "chilling",
+        "refrigerate",
+        "refrigerating",
+        "freeze",
+        "freezing",
+        "thaw",
+        "thawing",
+        "heat",
+        "heating",
+        "heat up",
+        "warm",
+        "warming",
+        "warm up",
+        "preheat",
+        "preheating",
+        "bring to a boil",
+        "bring to boil",
+        "bring to a simmer",
+        "reduce heat",
+        "reduce",
+        "reducing",
+        "increase heat",
+        "turn off",
+        "turn off heat",
+        "cover",
+        "covering",
+        "uncover",
+        "uncovering",
+    }
+)
 
 # Combine all methods for detection
-ALL_METHODS: set[str] = PRIMARY_METHODS | SECONDARY_METHODS
+ALL_METHODS: frozenset[str] = PRIMARY_METHODS | SECONDARY_METHODS
+
+
+def _longest_first(methods: frozenset[str]) -> tuple[str, ...]:
+    """Order methods longest first (ties alphabetically) so multi-word phrases are tried before their parts."""
+    return tuple(sorted(methods, key=lambda method: (-len(method), method)))
+
+
+_PRIMARY_ORDERED = _longest_first(PRIMARY_METHODS)
+_SECONDARY_ORDERED = _longest_first(SECONDARY_METHODS)
+
+# Longest first, so at each position the alternation reports the longest method starting there
+_METHODS_BY_LENGTH = _longest_first(ALL_METHODS)
+
+# Whole words only ("core" must not match "scorecard"). The zero-width lookahead lets matches
+# overlap ("stir-fry" also yields "fry") and one C-level scan replaces a test per method.
+_METHOD_SCAN_RE = re.compile(r"(?=\b(" + "|".join(re.escape(m) for m in _METHODS_BY_LENGTH) + r")\b)")
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _is_word_prefix(prefix: str, method: str) -> bool:
+    """Whether `method` starts with `prefix` followed by a word boundary ("stir" in "stir-fry", not "stirring")."""
+    if not method.startswith(prefix):
+        return False
+    if len(method) == len(prefix):
+        return True
+    return _is_word_char(prefix[-1]) != _is_word_char(method[len(prefix)])
+
+
+# Any shorter method that is a whole-word prefix of the longest match at a position also matches there
+_METHOD_PREFIXES: dict[str, tuple[str, ...]] = {
+    method: tuple(other for other in _METHODS_BY_LENGTH if _is_word_prefix(other, method))
+    for method in _METHODS_BY_LENGTH
+}
+
+
+def _surface_prefixes(method: str) -> tuple[str, ...]:
+    """Word prefixes that a method and its regular inflections all start with ("bake" -> "bak")."""
+    if " " in method or "-" in method:
+        return (method,)
+    if method.endswith("e"):
+        return (method[:-1],)
+    if method.endswith("y") and method[-2] not in "aeiou":
+        # "fry" -> "fried"
+        return (method, method[:-1] + "i")
+    return (method,)
 
 
-def extract_methods_from_text(text: str, use_spacy: bool = True) -> tuple[list[str], list[str]]:
+# Irregular inflections the spaCy lemmatizer maps back to a method ("ground" -> "grind")
+_IRREGULAR_METHOD_FORMS = ("ground", "froz")
+
+# Cheap test run before parsing with spaCy: a text with no word starting like any method
+# (or its inflections) can't yield a phrase or lemma match, so the spaCy parse is skipped.
+# Recall caveat: a verb whose lemma is a method but whose surface form starts differently
+# (irregulars not listed above) is missed.
+_METHOD_PREFILTER_RE = re.compile(
+    r"\b(?:"
+    + "|".join(
+        re.escape(prefix)
+        for prefix in sorted(
+            {prefix for method in ALL_METHODS for prefix in _surface_prefixes(method)} | set(_IRREGULAR_METHOD_FORMS)
+        )
+    )
+    + ")"
+)
+
+
+def _may_mention_method(text: str) -> bool:
+    """Return whether the text could contain a method, so it is worth parsing with spaCy."""
+    return _METHOD_PREFILTER_RE.search(lower_text(text)) is not None
+
+
+def extract_methods_from_text(text: str, use_spacy: bool = False) -> tuple[list[str], list[str]]:
     """Extract cooking methods from text.
 
     Args:
         text: Text to extract methods from (e.g., step description)
-        use_spacy: Whether to use spaCy-based extraction (default: True)
+        use_spacy: Whether to use spaCy-based extraction, which also catches inflected verbs
+            via lemmas (default: False, a single compiled-regex scan)
 
     Returns:
         Tuple of (primary_methods, secondary_methods)
     """
+    primary, secondary = _extract_methods_cached(text, use_spacy)
+    # Fresh lists so callers can't mutate the cached result
+    return list(primary), list(secondary)
+
+
+def extract_methods_batch(
+    texts: list[str], use_spacy: bool = False, docs: list[Doc] | None = None
+) -> list[tuple[list[str], list[str]]]:
+    """Extract cooking methods from several texts in one pass.
+
+    Args:
+        texts: Texts to extract methods from (e.g., every step description of a recipe)
+        use_spacy: Whether to use spaCy-based extraction (default: False)
+        docs: Already parsed `texts`, in the same order, to skip parsing them again (spaCy only)
+
+    Returns:
+        One (primary_methods, secondary_methods) tuple per text, in input order
+    """
+    if use_spacy and docs is not None:
+        found = {
+            text: _extract_methods_from_doc(doc)
+            for text, doc in zip(texts, docs, strict=True)
+            if _may_mention_method(text)
+        }
+        results = (found.get(text, ([], [])) for text in texts)
+    elif use_spacy:
+        # Parse every distinct text in one nlp.pipe batch instead of one nlp() call each
+        nlp = get_nlp()
+        unique_texts = [text for text in dict.fromkeys(texts) if _may_mention_method(text)]
+        parsed = nlp.pipe(unique_texts, batch_size=32, disable=_unused_pipes(nlp))
+        found = {text: _extract_methods_from_doc(doc) for text, doc in zip(unique_texts, parsed, strict=True)}
+        results = (found.get(text, ([], [])) for text in texts)
+    else:
+        extract = _extract_methods_cached
+        results = (extract(text, False) for text in texts)
+    return [(list(primary), list(secondary)) for primary, secondary in results]
+
+
+@lru_cache(maxsize=1024)
+def _extract_methods_cached(text: str, use_spacy: bool) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Memoized extraction; step texts are re-parsed often while navigating a recipe."""
     if use_spacy:
-        return _extract_methods_with_spacy(text)
+        primary, secondary = _extract_methods_with_spacy(text)
     else:
-        return _extract_methods_legacy(text)
+        primary, secondary = _extract_methods_legacy(text)
+    return tuple(primary), tuple(secondary)
+
+
+# Method extraction only reads POS tags, lemmas and stop words, so it skips these components
+_METHOD_UNUSED_PIPES = ("parser",)
+
+
+def _unused_pipes(nlp: Language) -> list[str]:
+    """Return the loaded pipeline components that method extraction doesn't need."""
+    return [name for name in _METHOD_UNUSED_PIPES if name in nlp.pipe_names]
+
+
+def _match_method_spans(doc: Doc) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+    """Find the token spans of primary and secondary methods in a parsed text.
+
+    One C-level scan of the lowercased text with `_METHOD_SCAN_RE` replaces running spaCy phrase
+    matchers over the doc. Character matches are mapped back to tokens, and those that don't fall
+    on token boundaries are dropped, as a phrase matcher would never produce them.
+
+    Args:
+        doc: Parsed text to search
+
+    Returns:
+        Tuple of (primary_spans, secondary_spans), each a sorted list of (start, end) token offsets
+    """
+    primary: set[tuple[int, int]] = set()
+    secondary: set[tuple[int, int]] = set()
+    for match in _METHOD_SCAN_RE.finditer(lower_text(doc.text)):
+        begin = match.start(1)
+        for method in _METHOD_PREFIXES[match.group(1)]:
+            span = doc.char_span(begin, begin + len(method))
+            if span is None:
+                continue
+            if method in PRIMARY_METHODS:
+                primary.add((span.start, span.end))
+            if method in SECONDARY_METHODS:
+                secondary.add((span.start, span.end))
+    return sorted(primary), sorted(secondary)
+
+
+def _longest_span_first(span: tuple[int, int]) -> tuple[int, int]:
+    """Sort key ordering token spans by length (longest first), then by position."""
+    start, end = span
+    return start - end, start
 
 
 def _extract_methods_with_spacy(text: str) -> tuple[list[str], list[str]]:
@@ -299,102 +476,107 @@ def _extract_methods_with_spacy(text: str) -> tuple[list[str], list[str]]:
     Returns:
         Tuple of (primary_methods, secondary_methods)
     """
+    if not _may_mention_method(text):
+        return [], []
     nlp = get_nlp()
-    doc = nlp(text)
-    found_primary = []
-    found_secondary = []
-    seen_primary = set()
-    seen_secondary = set()
+    return _extract_methods_from_doc(nlp(text, disable=_unused_pipes(nlp)))
 
-    # Create phrase matchers
-    primary_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
-    secondary_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
 
-    # Sort by length to match longer phrases first (prioritize multi-word phrases)
-    sorted_primary = sorted(PRIMARY_METHODS, key=len, reverse=True)
-    sorted_secondary = sorted(SECONDARY_METHODS, key=len, reverse=True)
+def _extract_methods_from_doc(doc: Doc) -> tuple[list[str], list[str]]:
+    """Extract methods from an already parsed text.
 
-    primary_patterns = [nlp.make_doc(method) for method in sorted_primary]
-    secondary_patterns = [nlp.make_doc(method) for method in sorted_secondary]
+    Args:
+        doc: Parsed text (needs POS tags and lemmas)
+
+    Returns:
+        Tuple of (primary_methods, secondary_methods)
+    """
+    seen_primary = set()
+    seen_secondary = set()
 
-    primary_matcher.add("PRIMARY_METHOD", primary_patterns)
-    secondary_matcher.add("SECONDARY_METHOD", secondary_patterns)
+    primary_spans, secondary_spans = _match_method_spans(doc)
 
-    # Track spans to avoid overlapping matches
-    matched_spans: set[tuple[int, int]] = set()
+    # Token positions claimed by an accepted method; overlapping shorter matches are skipped
+    covered = bytearray(len(doc))
+    primary_hits: list[tuple[int, str]] = []
+    secondary_hits: list[tuple[int, str]] = []
 
     # Find primary methods (longer phrases first)
-    primary_matches = primary_matcher(doc)
-    for _match_id, start, end in primary_matches:
-        span_range = (start, end)
-        # Skip if this span overlaps with already matched spans
-        if any(start < e and end > s for s, e in matched_spans):
+    for start, end in sorted(primary_spans, key=_longest_span_first):
+        if 1 in covered[start:end]:
             continue
 
         method = doc[start:end].text.lower()
-        base = _normalize_method(method)
+        base = _METHOD_BASE.get(method) or _normalize_method(method)
         if base not in seen_primary and base not in METHOD_EXCLUDE_WORDS:
-            found_primary.append(method)
+            primary_hits.append((start, method))
             seen_primary.add(base)
-            matched_spans.add(span_range)
+            covered[start:end] = b"\x01" * (end - start)
 
     # Find secondary methods (longer phrases first)
-    secondary_matches = secondary_matcher(doc)
-    for _match_id, start, end in secondary_matches:
-        span_range = (start, end)
-        # Skip if this span overlaps with already matched spans
-        if any(start < e and end > s for s, e in matched_spans):
+    for start, end in sorted(secondary_spans, key=_longest_span_first):
+        if 1 in covered[start:end]:
             continue
 
         method = doc[start:end].text.lower()
-        base = _normalize_method(method)
+        base = _METHOD_BASE.get(method) or _normalize_method(method)
         # Skip if already found in primary or if it's an excluded word
         if base not in seen_secondary and base not in seen_primary and base not in METHOD_EXCLUDE_WORDS:
-            found_secondary.append(method)
+            secondary_hits.append((start, method))
             seen_secondary.add(base)
-            matched_spans.add(span_range)
+            covered[start:end] = b"\x01" * (end - start)
+
+    # Report phrase matches in text order
+    found_primary = [method for _, method in sorted(primary_hits)]
+    found_secondary = [method for _, method in sorted(secondary_hits)]
 
     # Also check verb lemmas for methods (only if not already matched)
     for token in doc:
-        if token.pos_ == "VERB" and token.i not in [s for s, e in matched_spans for s in range(s, e)]:
-            lemma = token.lemma_
-            lower = token.lower_
+        if token.pos_ != "VERB" or covered[token.i]:
+            continue
+        lemma = token.lemma_
+        lower = token.lower_
 
-            # Skip excluded words
-            if lemma in METHOD_EXCLUDE_WORDS or lower in METHOD_EXCLUDE_WORDS:
-                continue
+        # Most verbs aren't methods; skip them before the context checks
+        if lemma not in _METHOD_INDEX and lower not in _METHOD_INDEX:
+            continue
 
-            # Additional context check: skip if token is part of a compound noun (ingredient)
-            # Check if preceded/followed by other nouns (likely ingredient name)
-            is_ingredient_part = False
-            if token.i > 0:
-                prev_token = doc[token.i - 1]
-                # "sour cream", "hash browns"
-                if prev_token.pos_ in ["ADJ", "NOUN"] and not prev_token.is_stop:
-                    is_ingredient_part = True
-            if token.i < len(doc) - 1:
-                next_token = doc[token.i + 1]
-                # "cream cheese", "mix together"
-                if next_token.pos_ == "NOUN" and next_token.lower_ not in ["together", "well", "until"]:
-                    is_ingredient_part = True
-
-            if is_ingredient_part:
-                continue
+        # Skip excluded words
+        if lemma in METHOD_EXCLUDE_WORDS or lower in METHOD_EXCLUDE_WORDS:
+            continue
 
-            # Check if verb lemma is a method
-            for form in [lemma, lower]:
-                if form in PRIMARY_METHODS:
-                    base = _normalize_method(form)
-                    if base not in seen_primary:
-                        found_primary.append(form)
-                        seen_primary.add(base)
-                        break
-                elif form in SECONDARY_METHODS:
-                    base = _normalize_method(form)
-                    if base not in seen_secondary and base not in seen_primary:
-                        found_secondary.append(form)
-                        seen_secondary.add(base)
-                        break
+        # Additional context check: skip if token is part of a compound noun (ingredient)
+        # Check if preceded/followed by other nouns (likely ingredient name)
+        is_ingredient_part = False
+        if token.i > 0:
+            prev_token = doc[token.i - 1]
+            # "sour cream", "hash browns"
+            if prev_token.pos_ in ["ADJ", "NOUN"] and not prev_token.is_stop:
+                is_ingredient_part = True
+        if token.i < len(doc) - 1:
+            next_token = doc[token.i + 1]
+            # "cream cheese", "mix together"
+            if next_token.pos_ == "NOUN" and next_token.lower_ not in ["together", "well", "until"]:
+                is_ingredient_part = True
+
+        if is_ingredient_part:
+            continue
+
+        # Check if verb lemma is a method
+        for form in (lemma, lower):
+            hit = _METHOD_INDEX.get(form)
+            if hit is None:
+                continue
+            is_primary, base = hit
+            if is_primary:
+                if base not in seen_primary:
+                    found_primary.append(form)
+                    seen_primary.add(base)
+                    break
+            elif base not in seen_secondary and base not in seen_primary:
+                found_secondary.append(form)
+                seen_secondary.add(base)
+                break
 
     return found_primary, found_secondary
 
@@ -416,8 +598,17 @@ def _normalize_method(method: str) -> str:
     return base
 
 
+# Normalized base of every known method, so matches are looked up instead of re-normalized
+_METHOD_BASE: dict[str, str] = {method: _normalize_method(method) for method in ALL_METHODS}
+
+# Every method form mapped to (is_primary, base) for a single lookup per verb token
+_METHOD_INDEX: dict[str, tuple[bool, str]] = {
+    method: (method in PRIMARY_METHODS, base) for method, base in _METHOD_BASE.items()
+}
+
+
 def _extract_methods_legacy(text: str) -> tuple[list[str], list[str]]:
-    """Legacy regex-based method extraction (fallback).
+    """Regex-based method extraction (the default, no spaCy parse needed).
 
     Args:
         text: Text to extract methods from
@@ -425,28 +616,44 @@ def _extract_methods_legacy(text: str) -> tuple[list[str], list[str]]:
     Returns:
         Tuple of (primary_methods, secondary_methods)
     """
-    text_lower = text.lower()
+    text_lower = lower_text(text)
     found_primary = []
     found_secondary = []
-
-    # Check for primary methods
-    for method in PRIMARY_METHODS:
-        if method in text_lower:
-            # Avoid duplicates (e.g., "fry" and "frying")
-            base_method = method.rstrip("ing").rstrip("e")
-            if base_method not in found_primary and method not in found_primary:
+    # Methods and their bases already taken, for O(1) duplicate checks
+    seen_primary: set[str] = set()
+    seen_secondary: set[str] = set()
+
+    for method in _scan_methods(text_lower):
+        # Avoid duplicates (e.g., "fry" and "frying")
+        base_method = _METHOD_BASE[method]
+        if method in PRIMARY_METHODS:
+            if base_method not in seen_primary and method not in seen_primary:
                 found_primary.append(method)
-
-    # Check for secondary methods
-    for method in SECONDARY_METHODS:
-        if method in text_lower:
-            base_method = method.rstrip("ing").rstrip("e")
-            if base_method not in found_secondary and method not in found_secondary:
+                seen_primary.update((base_method, method))
+        if method in SECONDARY_METHODS:
+            if base_method not in seen_secondary and method not in seen_secondary:
                 found_secondary.append(method)
+                seen_secondary.update((base_method, method))
 
     return found_primary, found_secondary
 
 
+def _scan_methods(text_lower: str) -> list[str]:
+    """Find every method occurring as whole words in the text.
+
+    Args:
+        text_lower: Lowercased text to scan
+
+    Returns:
+        Distinct methods in order of first occurrence
+    """
+    found: dict[str, None] = {}
+    for match in _METHOD_SCAN_RE.finditer(text_lower):
+        for method in _METHOD_PREFIXES[match.group(1)]:
+            found[method] = None
+    return list(found)
+
+
 def get_primary_method(text: str) -> str | None:
     """Get the main primary cooking method from text.
 
@@ -1,79 +1,136 @@
 """Recipe parser that fetches and parses recipes from URLs."""
 
+import copy
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
 from recipebot.crawler import extract_title_from_url, scrape_recipe
-from recipebot.model import Recipe
+from recipebot.model import Recipe, Step, StepTemperature, StepTime
+
+from .step import parse_steps_for_many_recipes, parse_steps_from_directions
+
+
+def _format_time(time: StepTime) -> str:
+    """Render a step's duration, e.g. "30 minute" or "5-7 minute"."""
+    if time.duration is not None:
+        return f"{time.duration} {time.unit or ''}"
+    if time.duration_min is not None:
+        return f"{time.duration_min}-{time.duration_max} {time.unit or ''}"
+    return ""
+
+
+def _format_temperature(temperature: StepTemperature) -> str:
+    """Render a step's temperatures, e.g. "oven: 350°F, heat: medium heat"."""
+    return ", ".join(f"{k}: {v}" for k, v in (("oven", temperature.oven), ("heat", temperature.heat)) if v)
+
+
+def steps_table(steps: list[Step], title: str = "Steps") -> Table:
+    """Lay out parsed steps as one table, a row per step and a column per attribute.
 
-from .step import parse_steps_from_directions
+    Args:
+        steps: Parsed steps to show
+        title: Table title
 
+    Returns:
+        Table: Renderable table, laid out in a single pass when printed
+    """
+    table = Table(title=title, show_header=True, show_lines=True)
+    table.add_column("#", justify="right")
+    table.add_column("Description", style="bold")
+    table.add_column("Ingredients", style="cyan")
+    table.add_column("Tools", style="magenta")
+    table.add_column("Methods", style="yellow")
+    table.add_column("Time", style="blue")
+    table.add_column("Temperature", style="red")
+    table.add_column("Actionable")
+    table.add_column("Prepared")
+
+    for step in steps:
+        table.add_row(
+            str(step.step_number),
+            step.description,
+            ", ".join(ing.name for ing in step.ingredients if ing.name),
+            ", ".join(step.tools),
+            ", ".join(step.methods),
+            _format_time(step.time) if step.time else "",
+            _format_temperature(step.temperature) if step.temperature else "",
+            str(step.actionable),
+            str(step.is_prepared),
+            # Informational steps stand out, matching the yellow border of their panels
+            style=None if step.actionable else "yellow",
+        )
+    return table
 
-def show_recipe(recipe: Recipe):
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
 
-    console = Console()
-    console.print(f"\n[bold cyan]Fetching recipe from:[/bold cyan] {recipe.url}\n")
-    console.print(f"[green]✓[/green] Found {recipe.title} recipe\n")
-    console.print(f"[green]✓[/green] Found {len(recipe.ingredients)} ingredients")
-    console.print(f"[green]✓[/green] Found {len(recipe.directions)} directions\n")
+def show_recipe(recipe: Recipe, console: Console | None = None):
+    if console is None:
+        console = Console()
+    # Buffer everything and write it out once, instead of a write per line, table and panel
+    with console:
+        console.print(f"\n[bold cyan]Fetching recipe from:[/bold cyan] {recipe.url}\n")
+        console.print(f"[green]✓[/green] Found {recipe.title} recipe\n")
+        console.print(f"[green]✓[/green] Found {len(recipe.ingredients)} ingredients")
+        console.print(f"[green]✓[/green] Found {len(recipe.directions)} directions\n")
 
-    console.print(f"[green]✓[/green] Parsed into {len(recipe.steps)} atomic steps\n")
+        console.print(f"[green]✓[/green] Parsed into {len(recipe.steps)} atomic steps\n")
 
-    # Display ingredients
-    ing_table = Table(title="Ingredients", show_header=True)
-    ing_table.add_column("Quantity", style="cyan")
-    ing_table.add_column("Unit", style="magenta")
-    ing_table.add_column("Name", style="green")
-    ing_table.add_column("Preparation", style="yellow")
-    ing_table.add_column("Misc", style="red")
+        # Display ingredients
+        ing_table = Table(title="Ingredients", show_header=True)
+        ing_table.add_column("Quantity", style="cyan")
+        ing_table.add_column("Unit", style="magenta")
+        ing_table.add_column("Name", style="green")
+        ing_table.add_column("Preparation", style="yellow")
+        ing_table.add_column("Misc", style="red")
 
-    for ing in recipe.ingredients:
-        ing_table.add_row(ing.quantity or "", ing.unit or "", ing.name or "", ing.preparation or "", ing.misc or "")
+        for ing in recipe.ingredients:
+            ing_table.add_row(ing.quantity or "", ing.unit or "", ing.name or "", ing.preparation or "", ing.misc or "")
 
-    console.print(ing_table)
-    console.print()
+        console.print(ing_table)
+        console.print()
 
-    # Display parsed steps
-    for i, step in enumerate(recipe.steps, 1):
-        # Create step panel
-        step_content = f"[bold]{step.description}[/bold]\n\n"
+        # Display parsed steps
+        for i, step in enumerate(recipe.steps, 1):
+            # Create step panel
+            step_content = f"[bold]{step.description}[/bold]\n\n"
 
-        if step.ingredients:
-            step_content += f"[cyan]Ingredients:[/cyan] {', '.join([ing.name for ing in step.ingredients])}\n"
+            if step.ingredients:
+                step_content += f"[cyan]Ingredients:[/cyan] {', '.join([ing.name for ing in step.ingredients])}\n"
 
-        if step.tools:
-            step_content += f"[magenta]Tools:[/magenta] {', '.join(step.tools)}\n"
+            if step.tools:
+                step_content += f"[magenta]Tools:[/magenta] {', '.join(step.tools)}\n"
 
-        if step.methods:
-            step_content += f"[yellow]Methods:[/yellow] {', '.join(step.methods)}\n"
+            if step.methods:
+                step_content += f"[yellow]Methods:[/yellow] {', '.join(step.methods)}\n"
 
-        if step.time:
-            time_str = ""
-            if "duration" in step.time:
-                time_str = f"{step.time['duration']} {step.time.get('unit', '')}"
-            elif "duration_min" in step.time:
-                time_str = f"{step.time['duration_min']}-{step.time['duration_max']} {step.time.get('unit', '')}"
-            else:
-                time_str = str(step.time.get("duration", ""))
-            step_content += f"[blue]Time:[/blue] {time_str}\n"
+            if step.time:
+                step_content += f"[blue]Time:[/blue] {_format_time(step.time)}\n"
 
-        if step.temperature:
-            temp_items = [f"{k}: {v}" for k, v in step.temperature.items()]
-            step_content += f"[red]Temperature:[/red] {', '.join(temp_items)}\n"
+            if step.temperature:
+                step_content += f"[red]Temperature:[/red] {_format_temperature(step.temperature)}\n"
 
-        step_content += f"\n[dim]Actionable: {step.actionable} | Preparatory: {step.is_prepared}[/dim]"
+            step_content += f"\n[dim]Actionable: {step.actionable} | Preparatory: {step.is_prepared}[/dim]"
 
-        panel = Panel(step_content, title=f"Step {i}", border_style="green" if step.actionable else "yellow")
-        console.print(panel)
+            panel = Panel(step_content, title=f"Step {i}", border_style="green" if step.actionable else "yellow")
+            console.print(panel)
 
-    console.print(
-        f"\n[bold green]✓ Successfully parsed {len(recipe.steps)} steps from {len(recipe.directions)} directions![/bold green]\n"  # noqa: E501
-    )
+        console.print(
+            f"\n[bold green]✓ Successfully parsed {len(recipe.steps)} steps from {len(recipe.directions)} directions![/bold green]\n"  # noqa: E501
+        )
 
 
 def parse_recipe(url: str, *, split_by_atomic_steps: bool = True, use_spacy: bool = True) -> Recipe:
     """Fetch and parse recipe from URL.
 
+    Results are cached per URL and options for up to `RECIPE_CACHE_TTL` seconds, so asking for the
+    same recipe again skips the download and parse while a long-running server still picks up
+    edited pages. Each call returns its own copy.
+
     Returns:
         Parsed Recipe object with ingredients, directions, and steps
 
@@ -81,6 +138,23 @@ def parse_recipe(url: str, *, split_by_atomic_steps: bool = True, use_spacy: boo
         ValueError: If URL is invalid or recipe cannot be parsed
         requests.HTTPError: If HTTP request fails
     """
+    # Keying on the current TTL window makes every entry expire when the window rolls over
+    ttl_window = int(time.monotonic() // RECIPE_CACHE_TTL)
+    recipe = _parse_recipe_cached(url, split_by_atomic_steps, use_spacy, ttl_window)
+    # Callers may mutate the recipe (e.g. rasa stores it in a slot), so never hand out the cached one
+    return copy.deepcopy(recipe)
+
+
+# Longest time a parsed recipe is reused before its page is fetched again
+RECIPE_CACHE_TTL = 60 * 60
+
+
+@lru_cache(maxsize=256)
+def _parse_recipe_cached(url: str, split_by_atomic_steps: bool, use_spacy: bool, ttl_window: int) -> Recipe:
+    """Memoized body of `parse_recipe`; failures raise and are not cached.
+
+    `ttl_window` is only part of the cache key.
+    """
     try:
         ingredients, directions = scrape_recipe(url)
         if not ingredients or not directions:
@@ -103,3 +177,64 @@ def parse_recipe(url: str, *, split_by_atomic_steps: bool = True, use_spacy: boo
         return recipe
     except Exception as e:
         raise ValueError(f"Failed to parse recipe from {url}: {e}") from e
+
+
+def parse_recipes(
+    urls: Sequence[str],
+    *,
+    split_by_atomic_steps: bool = True,
+    use_spacy: bool = True,
+    max_workers: int = 8,
+    n_process: int | None = None,
+) -> list[Recipe]:
+    """Fetch and parse several recipes, downloading the pages concurrently.
+
+    Scraping is network-bound, so the pages are fetched on a thread pool and the total wait is
+    close to that of the slowest page. With spaCy, the steps of every recipe are then parsed
+    together by `parse_steps_for_many_recipes`, which only starts worker processes for large batches.
+
+    Args:
+        urls: Recipe URLs to parse
+        split_by_atomic_steps: Whether to split complex directions into atomic steps
+        use_spacy: Whether to use spaCy-based parsing
+        max_workers: Maximum number of pages fetched at once
+        n_process: Number of spaCy worker processes (default: chosen by `parse_steps_for_many_recipes`
+            from the number of steps)
+
+    Returns:
+        Parsed Recipe objects, in the order of `urls`
+
+    Raises:
+        ValueError: If a URL is invalid or its recipe cannot be parsed
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+        scraped = list(executor.map(scrape_recipe, urls))
+
+    for url, (ingredients, directions) in zip(urls, scraped, strict=True):
+        if not ingredients or not directions:
+            raise ValueError(f"Failed to parse recipe from {url}")
+
+    if use_spacy:
+        recipe_steps = parse_steps_for_many_recipes(
+            [(directions, ingredients) for ingredients, directions in scraped],
+            split_by_atomic_steps=split_by_atomic_steps,
+            n_process=n_process,
+        )
+    else:
+        recipe_steps = [
+            parse_steps_from_directions(
+                directions, ingredients, split_by_atomic_steps=split_by_atomic_steps, use_spacy=False
+            )
+            for ingredients, directions in scraped
+        ]
+
+    return [
+        Recipe(
+            url=url,
+            title=extract_title_from_url(url),
+            ingredients=ingredients,
+            directions=directions,
+            steps=steps,
+        )
+        for url, (ingredients, directions), steps in zip(urls, scraped, recipe_steps, strict=True)
+    ]
@@ -1,14 +1,20 @@
 """SpaCy-based NLP utilities for recipe parsing optimization."""
 
 import re
+import threading
+from collections.abc import Iterable
+from functools import lru_cache
 
 import spacy
 from number_parser import parse as parse_number
 from spacy.matcher import Matcher, PhraseMatcher
 from spacy.tokens import Doc, Span
 
-# Global spaCy model (lazy loaded)
+from .text_utils import lower_text
+
+# Global spaCy model (lazy loaded); the lock lets a background warm-up and a first caller share one load
 _nlp = None
+_nlp_lock = threading.Lock()
 
 
 def get_nlp() -> spacy.language.Language:
@@ -19,13 +25,35 @@ def get_nlp() -> spacy.language.Language:
     """
     global _nlp
     if _nlp is None:
-        try:
-            _nlp = spacy.load("en_core_web_md")
-        except OSError:
-            raise RuntimeError("Failed to load spaCy model. Please ensure it is installed and available.")  # noqa: B904
+        with _nlp_lock:
+            if _nlp is None:
+                try:
+                    # Named entities are never read, so skip the NER forward pass on every Doc
+                    _nlp = spacy.load("en_core_web_md", disable=["ner"])
+                except OSError:
+                    raise RuntimeError(  # noqa: B904
+                        "Failed to load spaCy model. Please ensure it is installed and available."
+                    )
     return _nlp
 
 
+# Rule-based sentence splitter (lazy loaded); sentence boundaries need no tagger or parser
+_nlp_sent = None
+
+
+def get_sentencizer_nlp() -> spacy.language.Language:
+    """Get or initialize a blank English pipeline with only the rule-based sentencizer.
+
+    Returns:
+        spaCy pipeline for sentence splitting
+    """
+    global _nlp_sent
+    if _nlp_sent is None:
+        _nlp_sent = spacy.blank("en")
+        _nlp_sent.add_pipe("sentencizer")
+    return _nlp_sent
+
+
 def create_time_matcher(nlp: spacy.language.Language) -> Matcher:
     """Create a spaCy matcher for time expressions.
 
@@ -37,6 +65,9 @@ def create_time_matcher(nlp: spacy.language.Language) -> Matcher:
     """
     matcher = Matcher(nlp.vocab)
 
+    # No greedy filters on the time patterns: spaCy moves filtered matches after the others,
+    # longest first, and the first time in the text must win
+
     # Pattern: "30 minutes", "2 hours", "5 seconds", "1 ½ hours" (fraction as separate token)
     matcher.add(
         "TIME_DURATION",
@@ -232,7 +263,7 @@ def create_tool_phrase_matcher(nlp: spacy.language.Language, tools: set[str]) ->
         Configured PhraseMatcher for tools
     """
     matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
-    patterns = [nlp.make_doc(tool) for tool in tools]
+    patterns = list(nlp.tokenizer.pipe(tools))
     matcher.add("TOOL", patterns)
     return matcher
 
@@ -248,7 +279,7 @@ def create_method_phrase_matcher(nlp: spacy.language.Language, methods: set[str]
         Configured PhraseMatcher for methods
     """
     matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
-    patterns = [nlp.make_doc(method) for method in methods]
+    patterns = list(nlp.tokenizer.pipe(methods))
     matcher.add("METHOD", patterns)
     return matcher
 
@@ -326,6 +357,30 @@ def _parse_number_with_fraction(text: str) -> float:
         return 0.0
 
 
+# Time unit spellings mapped to the singular unit stored on a step
+TIME_UNITS = {
+    "hour": "hour",
+    "hours": "hour",
+    "hr": "hour",
+    "hrs": "hour",
+    "minute": "minute",
+    "minutes": "minute",
+    "min": "minute",
+    "mins": "minute",
+    "second": "second",
+    "seconds": "second",
+    "sec": "second",
+    "secs": "second",
+}
+
+# Unicode vulgar fractions that can appear inside a quantity token
+_FRACTION_CHARS = ("½", "⅓", "⅔", "¼", "¾", "⅕", "⅖", "⅗", "⅘", "⅙", "⅚", "⅛", "⅜", "⅝", "⅞")
+
+
+# Order in which time matches are considered
+_TIME_MATCH_PRIORITY = {"TIME_RANGE": 0, "TIME_DURATION": 1, "TIME_FOR": 1, "TIME_UNTIL": 2}
+
+
 def extract_time_with_spacy(doc: Doc, time_matcher: Matcher) -> dict[str, str | int | float]:
     """Extract time information using spaCy matcher.
 
@@ -337,25 +392,20 @@ def extract_time_with_spacy(doc: Doc, time_matcher: Matcher) -> dict[str, str |
         Dictionary with time information
     """
     time_info: dict[str, str | int | float] = {}
-    matches = time_matcher(doc)
+    spans = time_matcher(doc, as_spans=True)
 
     # Prioritize numeric time patterns over qualitative ones
     # Sort matches: RANGE, DURATION, FOR, then UNTIL
-    match_priority = {"TIME_RANGE": 0, "TIME_DURATION": 1, "TIME_FOR": 1, "TIME_UNTIL": 2}
-    sorted_matches = sorted(matches, key=lambda m: match_priority.get(doc.vocab.strings[m[0]], 3))
+    sorted_spans = sorted(spans, key=lambda span: _TIME_MATCH_PRIORITY.get(span.label_, 3))
 
-    for match_id, start, end in sorted_matches:
-        span = doc[start:end]
-        match_type = doc.vocab.strings[match_id]
+    for span in sorted_spans:
+        match_type = span.label_
 
         if match_type == "TIME_RANGE":
             # Extract min and max values, handling fractions (including adjacent tokens)
             numbers = []
             for token in span:
-                if token.like_num or any(
-                    frac in token.text
-                    for frac in ["½", "⅓", "⅔", "¼", "¾", "⅕", "⅖", "⅗", "⅘", "⅙", "⅚", "⅛", "⅜", "⅝", "⅞"]
-                ):
+                if token.like_num or any(frac in token.text for frac in _FRACTION_CHARS):
                     numbers.append(token.text)
 
             # Handle different number patterns
@@ -381,14 +431,9 @@ def extract_time_with_spacy(doc: Doc, time_matcher: Matcher) -> dict[str, str |
             if "duration_min" in time_info:
                 # Extract unit
                 for token in span:
-                    if token.lower_ in ["hour", "hours", "hr", "hrs"]:
-                        time_info["unit"] = "hour"
-                        break
-                    elif token.lower_ in ["minute", "minutes", "min", "mins"]:
-                        time_info["unit"] = "minute"
-                        break
-                    elif token.lower_ in ["second", "seconds", "sec", "secs"]:
-                        time_info["unit"] = "second"
+                    unit = TIME_UNITS.get(token.lower_)
+                    if unit is not None:
+                        time_info["unit"] = unit
                         break
                 return time_info
 
@@ -396,17 +441,10 @@ def extract_time_with_spacy(doc: Doc, time_matcher: Matcher) -> dict[str, str |
             # Extract single value, handling fractions (including separate tokens)
             numbers = []
             for token in span:
-                if token.like_num or any(
-                    frac in token.text
-                    for frac in ["½", "⅓", "⅔", "¼", "¾", "⅕", "⅖", "⅗", "⅘", "⅙", "⅚", "⅛", "⅜", "⅝", "⅞"]
-                ):
+                if token.like_num or any(frac in token.text for frac in _FRACTION_CHARS):
                     numbers.append(token.text)
-                elif token.lower_ in ["hour", "hours", "hr", "hrs"]:
-                    time_info["unit"] = "hour"
-                elif token.lower_ in ["minute", "minutes", "min", "mins"]:
-                    time_info["unit"] = "minute"
-                elif token.lower_ in ["second", "seconds", "sec", "secs"]:
-                    time_info["unit"] = "second"
+                elif token.lower_ in TIME_UNITS:
+                    time_info["unit"] = TIME_UNITS[token.lower_]
 
             # Combine adjacent numbers and fractions (e.g., "1" + "½" = 1.5)
             if len(numbers) == 2:
@@ -443,11 +481,9 @@ def extract_temperature_with_spacy(doc: Doc, temp_matcher: Matcher) -> dict[str,
         Dictionary with temperature information
     """
     temp_info: dict[str, str] = {}
-    matches = temp_matcher(doc)
 
-    for match_id, start, end in matches:
-        span = doc[start:end]
-        match_type = doc.vocab.strings[match_id]
+    for span in temp_matcher(doc, as_spans=True):
+        match_type = span.label_
 
         if match_type in ["TEMP_NUMERIC", "TEMP_PREHEAT"]:
             # Extract numeric temperature
@@ -474,25 +510,32 @@ def extract_temperature_with_spacy(doc: Doc, temp_matcher: Matcher) -> dict[str,
     return temp_info
 
 
-def split_into_sentences_with_spacy(text: str, nlp: spacy.language.Language) -> list[str]:
+# ", then" / ", and then" inside a sentence, where cooking steps are split further
+_THEN_SPLITTER = re.compile(r",\s+(and\s+)?then\s+", flags=re.IGNORECASE)
+
+
+def split_into_sentences_with_spacy(text: str, nlp: spacy.language.Language, doc: Doc | None = None) -> list[str]:
     """Split text into sentences using spaCy's sentence segmentation.
 
     Args:
         text: Text to split
-        nlp: spaCy language model
+        nlp: spaCy pipeline that sets sentence boundaries (e.g., `get_sentencizer_nlp()`)
+        doc: Already parsed `text`, to skip parsing it again
 
     Returns:
         List of sentence strings
     """
-    doc = nlp(text)
+    if doc is None:
+        doc = nlp(text)
     sentences = []
 
     for sent in doc.sents:
         sent_text = sent.text.strip()
+        sent_lower = sent_text.lower()
         # Additional splitting for cooking-specific patterns
         # Split on ", then" and similar conjunctions
-        if ", then" in sent_text.lower() or ", and then" in sent_text.lower():
-            parts = re.split(r",\s+(and\s+)?then\s+", sent_text, flags=re.IGNORECASE)
+        if ", then" in sent_lower or ", and then" in sent_lower:
+            parts = _THEN_SPLITTER.split(sent_text)
             for i, part in enumerate(parts):
                 if part is None:
                     continue
@@ -536,38 +579,73 @@ def extract_verb_phrases(doc: Doc) -> list[Span]:
     return verb_phrases
 
 
-def match_ingredient_with_spacy(ingredient_name: str, doc: Doc, nlp: spacy.language.Language) -> bool:
+def content_lemmas(doc: Doc | Span) -> frozenset[str]:
+    """Collect the lemmas of the non-stop words in a Doc or Span.
+
+    Args:
+        doc: spaCy Doc or Span
+
+    Returns:
+        Set of lemmas
+    """
+    return frozenset(token.lemma_ for token in doc if not token.is_stop)
+
+
+def ingredient_lemma_sets(ingredient_names: Iterable[str], nlp: spacy.language.Language) -> dict[str, frozenset[str]]:
+    """Parse ingredient names in one batch and collect their content lemmas.
+
+    Args:
+        ingredient_names: Ingredient names (e.g., every ingredient of a recipe)
+        nlp: spaCy language model
+
+    Returns:
+        Dictionary mapping each lowercased name to its lemma set
+    """
+    names = list(dict.fromkeys(lower_text(name) for name in ingredient_names))
+    return {name: content_lemmas(doc) for name, doc in zip(names, nlp.pipe(names), strict=True)}
+
+
+@lru_cache(maxsize=512)
+def _ingredient_lemmas(ingredient_name: str, nlp: spacy.language.Language) -> frozenset[str]:
+    """Lemmas of the non-stop words of an ingredient name, parsed once per name rather than once per step."""
+    return content_lemmas(nlp(ingredient_name))
+
+
+def match_ingredient_with_spacy(
+    ingredient_name: str,
+    doc: Doc,
+    nlp: spacy.language.Language,
+    ingredient_lemmas: frozenset[str] | None = None,
+    doc_lemmas: frozenset[str] | None = None,
+) -> bool:
     """Check if an ingredient is mentioned in a Doc using semantic similarity.
 
     Args:
         ingredient_name: Name of ingredient to find
         doc: spaCy Doc to search in
         nlp: spaCy language model
+        ingredient_lemmas: Precomputed `content_lemmas` of the lowercased name, if available
+        doc_lemmas: Precomputed `content_lemmas(doc)`, if available
 
     Returns:
         True if ingredient is found, False otherwise
     """
-    ingredient_doc = nlp(ingredient_name.lower())
-    doc_lower = doc.text.lower()
+    # Both lowercased copies are cached, since every step is checked against every ingredient
+    doc_lower = lower_text(doc.text)
+    name_lower = lower_text(ingredient_name)
 
     # First try exact match
-    if ingredient_name.lower() in doc_lower:
+    if name_lower in doc_lower:
         return True
 
     # Try lemma-based matching
-    ingredient_lemmas = set(token.lemma_ for token in ingredient_doc if not token.is_stop)
-
-    for token in doc:
-        if token.lemma_ in ingredient_lemmas and not token.is_stop:
-            return True
+    if ingredient_lemmas is None:
+        ingredient_lemmas = _ingredient_lemmas(name_lower, nlp)
+    if doc_lemmas is None:
+        doc_lemmas = content_lemmas(doc)
 
-    # Check noun chunks
-    for chunk in doc.noun_chunks:
-        chunk_lemmas = set(token.lemma_ for token in chunk if not token.is_stop)
-        if chunk_lemmas & ingredient_lemmas:  # Intersection
-            return True
-
-    return False
+    # Noun chunks are made of the doc's own tokens, so their lemmas are already covered here
+    return not doc_lemmas.isdisjoint(ingredient_lemmas)
 
 
 def get_action_verbs(doc: Doc) -> list[str]:
@@ -1,21 +1,31 @@
 """Step parser for converting raw directions into structured steps."""
 
+import os
 import re
+from functools import lru_cache
+from itertools import chain
 from typing import Literal
 
-from recipebot.model import Ingredient, Step
+from spacy.matcher import Matcher
+from spacy.tokens import Doc
 
-from .methods import extract_methods_from_text
+from recipebot.model import Ingredient, Step, StepTemperature, StepTime
+
+from .methods import extract_methods_batch
 from .spacy_utils import (
+    TIME_UNITS,
+    content_lemmas,
     create_temperature_matcher,
     create_time_matcher,
     extract_temperature_with_spacy,
     extract_time_with_spacy,
     get_nlp,
-    is_imperative_sentence,
+    get_sentencizer_nlp,
+    ingredient_lemma_sets,
     match_ingredient_with_spacy,
     split_into_sentences_with_spacy,
 )
+from .text_utils import lower_text
 from .tools import extract_tools_from_text
 
 # Regular expressions for time extraction
@@ -33,6 +43,12 @@ TIME_PATTERNS = [
     ),  # "30 minutes", "1 hour"
 ]
 
+# Qualitative time descriptions, used when no numeric time is given
+QUALITATIVE_TIME_PATTERNS = [
+    re.compile(r"until\s+(golden|brown|soft|tender|translucent|cooked|done)", flags=re.IGNORECASE),
+    re.compile(r"until\s+(.+?)\s+(?:is|are)", flags=re.IGNORECASE),
+]
+
 # Regular expressions for temperature extraction
 TEMP_PATTERNS = [
     re.compile(r"(\d+)\s*(?:degrees?|°)\s*([FC])", flags=re.IGNORECASE),  # "350 degrees F" or "350°F"
@@ -40,6 +56,9 @@ TEMP_PATTERNS = [
     re.compile(r"(low|medium|high|medium-low|medium-high)\s+heat", flags=re.IGNORECASE),  # "medium heat"
 ]
 
+# Preheat references without an explicit unit ("preheat the oven to 350")
+PREHEAT_PATTERN = re.compile(r"preheat.*?(\d+)\s*°?\s*([FC])?")
+
 # Sentence splitting patterns
 SENTENCE_SPLITTERS = [
     re.compile(r"\.\s+(?=[A-Z])", flags=re.IGNORECASE),  # Period followed by capital letter (lookahead)
@@ -49,73 +68,141 @@ SENTENCE_SPLITTERS = [
     re.compile(r"\s+meanwhile\s+", flags=re.IGNORECASE),  # " meanwhile "
     re.compile(r"\s+while\s+", flags=re.IGNORECASE),  # " while "
 ]
+# All splitters as one alternation, so a direction is split in a single pass
+SENTENCE_SPLITTER = re.compile("|".join(splitter.pattern for splitter in SENTENCE_SPLITTERS), flags=re.IGNORECASE)
+
+# Conjunction left at the start of a split-off step
+LEADING_CONJUNCTION = re.compile(r"^(then|and|meanwhile|while)\s+", flags=re.IGNORECASE)
+
+# Step classification phrases, checked in this order (warning, advice, observation, preparation)
+WARNING_PHRASES = ("be careful", "do not", "don't", "avoid", "make sure", "watch", "be sure", "ensure")
+ADVICE_PHRASES = ("you can", "alternatively", "tip:", "note:", "optional", "if desired", "for best results")
+OBSERVATION_PHRASES = (
+    "will be",
+    "should be",
+    "will look",
+    "should look",
+    "will become",
+    "it will",
+    "this will",
+    "the mixture will",
+)
+PREPARATION_PHRASES = (
+    "set aside",
+    "reserve",
+    "let stand",
+    "let sit",
+    "let rest",
+    "let cool",
+    "refrigerate",
+    "chill",
+    "freeze",
+)
+
+# (actionable, is_prepared, info_type), as returned by classify_step_type
+StepType = tuple[bool, bool, Literal["warning", "advice", "observation"] | None]
+
+
+# spaCy matchers (lazy loaded, compiled once and shared by all calls)
+_time_matcher: Matcher | None = None
+_temp_matcher: Matcher | None = None
+
+
+def _get_time_matcher() -> Matcher:
+    """Get or build the time expression matcher.
+
+    Returns:
+        Matcher for time patterns
+    """
+    global _time_matcher
+    if _time_matcher is None:
+        _time_matcher = create_time_matcher(get_nlp())
+    return _time_matcher
+
+
+def _get_temp_matcher() -> Matcher:
+    """Get or build the temperature expression matcher.
+
+    Returns:
+        Matcher for temperature patterns
+    """
+    global _temp_matcher
+    if _temp_matcher is None:
+        _temp_matcher = create_temperature_matcher(get_nlp())
+    return _temp_matcher
+
+
+# Unit spellings accepted by the legacy time parser, including single-letter abbreviations
+_LEGACY_TIME_UNITS = {**TIME_UNITS, "h": "hour", "m": "minute", "s": "second"}
+
 
+def _normalize_unit_to_singular(unit: str) -> str:
+    """Normalize unit to singular form for consistent storage."""
+    if not unit:
+        return "minute"
+    unit_lower = unit.lower()
+    return _LEGACY_TIME_UNITS.get(unit_lower, unit_lower)
 
-def extract_time_from_text(text: str, use_spacy: bool = True) -> dict[str, str | int]:
+
+def extract_time_from_text(text: str, use_spacy: bool = True, doc: Doc | None = None) -> dict[str, str | int]:
     """Extract time/duration information from text.
 
     Args:
         text: Text to extract time from
         use_spacy: Whether to use spaCy-based extraction (default: True)
+        doc: Already parsed `text`, to skip parsing it again (spaCy only)
 
     Returns:
         Dictionary with time information
     """
     if use_spacy:
         nlp = get_nlp()
-        doc = nlp(text)
-        time_matcher = create_time_matcher(nlp)
-        spacy_time_info = extract_time_with_spacy(doc, time_matcher)
+        if doc is None:
+            doc = nlp(text)
+        spacy_time_info = extract_time_with_spacy(doc, _get_time_matcher())
         if spacy_time_info:
             return spacy_time_info
         # Fall back to regex if spaCy doesn't find anything
 
-    # Legacy regex-based extraction
+    return dict(_extract_time_legacy(text))
+
+
+@lru_cache(maxsize=4096)
+def _extract_time_legacy(text: str) -> dict[str, str | int]:
+    """Legacy regex-based time extraction, memoized since recipes repeat step phrasing.
+
+    Callers must copy the returned dictionary before handing it out.
+
+    Args:
+        text: Text to extract time from
+
+    Returns:
+        Dictionary with time information
+    """
     time_info: dict[str, str | int] = {}
-    text_lower = text.lower()
-
-    # Normalize unit to singular form for consistent storage
-    def normalize_unit_to_singular(unit: str) -> str:
-        """Normalize unit to singular form."""
-        if not unit:
-            return "minute"
-        unit_lower = unit.lower()
-        # Map to singular forms
-        if unit_lower in ["hour", "hours", "hr", "hrs", "h"]:
-            return "hour"
-        elif unit_lower in ["minute", "minutes", "min", "mins", "m"]:
-            return "minute"
-        elif unit_lower in ["second", "seconds", "sec", "secs", "s"]:
-            return "second"
-        return unit_lower
+    text_lower = lower_text(text)
 
     # Check for range patterns first (e.g., "2-3 hours")
-    range_match = re.search(TIME_PATTERNS[0], text_lower)
+    range_match = TIME_PATTERNS[0].search(text_lower)
     if range_match:
         min_val, max_val, unit = range_match.groups()
         time_info["duration_min"] = int(float(min_val))
         time_info["duration_max"] = int(float(max_val))
-        time_info["unit"] = normalize_unit_to_singular(unit)
+        time_info["unit"] = _normalize_unit_to_singular(unit)
         return time_info
 
     # Check for single value patterns
     for pattern in TIME_PATTERNS[1:]:
-        match = re.search(pattern, text_lower)
+        match = pattern.search(text_lower)
         if match:
-            if len(match.groups()) == 2:
-                value, unit = match.groups()
-                time_info["duration"] = int(float(value))
-                time_info["unit"] = normalize_unit_to_singular(unit)
+            value, unit = match.groups()
+            time_info["duration"] = int(float(value))
+            time_info["unit"] = _normalize_unit_to_singular(unit)
             return time_info
 
     # Check for qualitative time descriptions
-    qualitative_patterns = [
-        re.compile(r"until\s+(golden|brown|soft|tender|translucent|cooked|done)", flags=re.IGNORECASE),
-        re.compile(r"until\s+(.+?)\s+(?:is|are)", flags=re.IGNORECASE),
-    ]
-
-    for pattern in qualitative_patterns:
-        match = re.search(pattern, text_lower)
+    for pattern in QUALITATIVE_TIME_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             time_info["duration"] = match.group(0)
             time_info["type"] = "qualitative"
@@ -124,31 +211,48 @@ def extract_time_from_text(text: str, use_spacy: bool = True) -> dict[str, str |
     return time_info
 
 
-def extract_temperature_from_text(text: str, use_spacy: bool = True) -> dict[str, str]:
+def extract_temperature_from_text(text: str, use_spacy: bool = True, doc: Doc | None = None) -> dict[str, str]:
     """Extract temperature information from text.
 
     Args:
         text: Text to extract temperature from
         use_spacy: Whether to use spaCy-based extraction (default: True)
+        doc: Already parsed `text`, to skip parsing it again (spaCy only)
 
     Returns:
         Dictionary with temperature information
     """
     if use_spacy:
         nlp = get_nlp()
-        doc = nlp(text)
-        temp_matcher = create_temperature_matcher(nlp)
-        spacy_temp_info = extract_temperature_with_spacy(doc, temp_matcher)
+        if doc is None:
+            doc = nlp(text)
+        spacy_temp_info = extract_temperature_with_spacy(doc, _get_temp_matcher())
         if spacy_temp_info:
             return spacy_temp_info
         # Fall back to regex if spaCy doesn't find anything
 
-    # Legacy regex-based extraction
+    return dict(_extract_temperature_legacy(text))
+
+
+@lru_cache(maxsize=4096)
+def _extract_temperature_legacy(text: str) -> dict[str, str]:
+    """Legacy regex-based temperature extraction, memoized since recipes repeat step phrasing.
+
+    Callers must copy the returned dictionary before handing it out.
+
+    Args:
+        text: Text to extract temperature from
+
+    Returns:
+        Dictionary with temperature information
+    """
     temp_info: dict[str, str] = {}
 
+    text_lower = lower_text(text)
+
     # Check for numeric temperature patterns
-    for pattern in TEMP_PATTERNS[:3]:
-        match = re.search(pattern, text.lower())
+    for pattern in TEMP_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             if len(match.groups()) == 2:
                 temp, unit = match.groups()
@@ -160,7 +264,7 @@ def extract_temperature_from_text(text: str, use_spacy: bool = True) -> dict[str
             return temp_info
 
     # Check for preheat references
-    preheat_match = re.search(r"preheat.*?(\d+)\s*°?\s*([FC])?", text.lower())
+    preheat_match = PREHEAT_PATTERN.search(text_lower)
     if preheat_match:
         temp = preheat_match.group(1)
         unit = preheat_match.group(2) or "F"
@@ -169,25 +273,25 @@ def extract_temperature_from_text(text: str, use_spacy: bool = True) -> dict[str
     return temp_info
 
 
-def split_into_atomic_steps(direction: str, use_spacy: bool = True) -> list[str]:
+def split_into_atomic_steps(direction: str, use_spacy: bool = True, doc: Doc | None = None) -> list[str]:
     """Split a complex direction into atomic steps.
 
     Args:
         direction: Single direction text
         use_spacy: Whether to use spaCy-based splitting (default: True)
+        doc: `direction` already split into sentences, to skip parsing it again (spaCy only)
 
     Returns:
         List of atomic step descriptions
     """
     if use_spacy:
-        nlp = get_nlp()
-        sentences = split_into_sentences_with_spacy(direction, nlp)
+        sentences = split_into_sentences_with_spacy(direction, get_sentencizer_nlp(), doc)
 
         # Clean up steps
         cleaned_steps = []
         for step in sentences:
             # Remove leading conjunctions
-            step = re.sub(r"^(then|and|meanwhile|while)\s+", "", step, flags=re.IGNORECASE)
+            step = LEADING_CONJUNCTION.sub("", step)
             # Ensure first letter is capitalized
             if step:
                 step = step[0].upper() + step[1:]
@@ -195,23 +299,12 @@ def split_into_atomic_steps(direction: str, use_spacy: bool = True) -> list[str]
 
         return cleaned_steps if cleaned_steps else [direction]
 
-    # Legacy regex-based splitting
-    steps = [direction]
-
-    # Split by sentence boundaries with conjunctions
-    for splitter in SENTENCE_SPLITTERS:
-        new_steps = []
-        for step in steps:
-            # Find all split points
-            parts = re.split(splitter, step)
-            new_steps.extend([p.strip() for p in parts if p.strip()])
-        steps = new_steps
-
-    # Clean up steps
+    # Legacy regex-based splitting by sentence boundaries with conjunctions
     cleaned_steps = []
-    for step in steps:
+    for step in SENTENCE_SPLITTER.split(direction):
+        step = step.strip()
         # Remove leading conjunctions
-        step = re.sub(r"^(then|and|meanwhile|while)\s+", "", step, flags=re.IGNORECASE)
+        step = LEADING_CONJUNCTION.sub("", step)
         # Ensure first letter is capitalized
         if step:
             step = step[0].upper() + step[1:]
@@ -220,44 +313,27 @@ def split_into_atomic_steps(direction: str, use_spacy: bool = True) -> list[str]
     return cleaned_steps if cleaned_steps else [direction]
 
 
-def classify_step_type(
-    text: str, use_spacy: bool = True
-) -> tuple[bool, bool, Literal["warning", "advice", "observation"] | None]:
+def classify_step_type(text: str, use_spacy: bool = True, doc: Doc | None = None) -> StepType:
     """Classify step as actionable, preparatory, or informational.
 
     Args:
         text: Step description
         use_spacy: Whether to use spaCy-based classification (default: True)
+        doc: Already parsed `text`, to skip parsing it again (spaCy only)
 
     Returns:
         Tuple of (actionable, is_prepared, info_type)
     """
-    text_lower = text.lower()
-
-    # Enhanced classification using spaCy
-    if use_spacy:
-        nlp = get_nlp()
-        doc = nlp(text)
-
-        # Check if it's an imperative sentence (command) -> more likely actionable
-        _is_imperative = is_imperative_sentence(doc)
-
-    # Check for warnings
-    warning_patterns = ["be careful", "do not", "don't", "avoid", "make sure", "watch", "be sure", "ensure"]
-    for pattern in warning_patterns:
-        if pattern in text_lower:
-            return (True, False, "warning")
-
-    # Check for advice
-    advice_patterns = ["you can", "alternatively", "tip:", "note:", "optional", "if desired", "for best results"]
-    for pattern in advice_patterns:
-        if pattern in text_lower:
-            return (False, False, "advice")
+    text_lower = lower_text(text)
+    phrase_type, default_type = _classify_by_phrases(text_lower)
+    if phrase_type is not None:
+        return phrase_type
 
-    # Check for observations (using spaCy for better detection)
+    # Check for observations (using spaCy for better detection); the text is only parsed
+    # here, once, so warnings and advice never pay for a parse
     if use_spacy:
-        nlp = get_nlp()
-        doc = nlp(text)
+        if doc is None:
+            doc = get_nlp()(text)
         # Look for future tense patterns
         for token in doc:
             if token.tag_ in ["MD"] and token.lower_ in ["will", "should"]:  # Modal verbs
@@ -266,40 +342,51 @@ def classify_step_type(
                     if child.lemma_ in ["be", "look", "become"]:
                         return (False, False, "observation")
 
-    observation_patterns = [
-        "will be",
-        "should be",
-        "will look",
-        "should look",
-        "will become",
-        "it will",
-        "this will",
-        "the mixture will",
-    ]
-    for pattern in observation_patterns:
+    return default_type
+
+
+@lru_cache(maxsize=4096)
+def _classify_by_phrases(text_lower: str) -> tuple[StepType | None, StepType]:
+    """Phrase-based part of `classify_step_type`, memoized since recipes repeat step phrasing.
+
+    Args:
+        text_lower: Lowercased step description
+
+    Returns:
+        Tuple of (warning/advice classification that wins over spaCy's observation check, or None;
+        classification from the remaining phrases)
+    """
+    # Check for warnings
+    for pattern in WARNING_PHRASES:
+        if pattern in text_lower:
+            return (True, False, "warning"), (True, False, "warning")
+
+    # Check for advice
+    for pattern in ADVICE_PHRASES:
         if pattern in text_lower:
-            return (False, False, "observation")
+            return (False, False, "advice"), (False, False, "advice")
+
+    for pattern in OBSERVATION_PHRASES:
+        if pattern in text_lower:
+            return None, (False, False, "observation")
 
     # Check if preparatory (for future steps)
-    prep_patterns = [
-        "set aside",
-        "reserve",
-        "let stand",
-        "let sit",
-        "let rest",
-        "let cool",
-        "refrigerate",
-        "chill",
-        "freeze",
-    ]
-    is_prepared = any(pattern in text_lower for pattern in prep_patterns)
+    is_prepared = False
+    for pattern in PREPARATION_PHRASES:
+        if pattern in text_lower:
+            is_prepared = True
+            break
 
     # Default: actionable
-    return (True, is_prepared, None)
+    return None, (True, is_prepared, None)
 
 
 def extract_ingredients_from_step(
-    step_text: str, all_ingredients: list[Ingredient], use_spacy: bool = True
+    step_text: str,
+    all_ingredients: list[Ingredient],
+    use_spacy: bool = True,
+    doc: Doc | None = None,
+    ingredient_lemmas: dict[str, frozenset[str]] | None = None,
 ) -> list[Ingredient]:
     """Find which ingredients from the recipe are mentioned in this step.
 
@@ -307,24 +394,31 @@ def extract_ingredients_from_step(
         step_text: Step description
         all_ingredients: List of all ingredients in recipe
         use_spacy: Whether to use spaCy-based matching (default: True)
+        doc: Already parsed `step_text`, to skip parsing it again (spaCy only)
+        ingredient_lemmas: Lemma sets from `ingredient_lemma_sets` for `all_ingredients` (spaCy only)
 
     Returns:
         List of ingredients used in this step
     """
     if use_spacy:
         nlp = get_nlp()
-        doc = nlp(step_text)
+        if doc is None:
+            doc = nlp(step_text)
+        step_lemmas = content_lemmas(doc)
         found_ingredients = []
 
         for ingredient in all_ingredients:
             # Handle potential None values for ingredient.name
-            if ingredient.name is not None and match_ingredient_with_spacy(ingredient.name, doc, nlp):
+            if ingredient.name is None:
+                continue
+            lemmas = ingredient_lemmas.get(lower_text(ingredient.name)) if ingredient_lemmas else None
+            if match_ingredient_with_spacy(ingredient.name, doc, nlp, lemmas, step_lemmas):
                 found_ingredients.append(ingredient)
 
         return found_ingredients
 
     # Legacy string-based matching
-    step_text_lower = step_text.lower()
+    step_text_lower = lower_text(step_text)
     found_ingredients = []
 
     for ingredient in all_ingredients:
@@ -332,30 +426,28 @@ def extract_ingredients_from_step(
         if ingredient.name is None:
             continue
 
-        # Check for ingredient name or variations
-        name_lower = ingredient.name.lower()
-
-        # Direct match
-        if name_lower in step_text_lower:
+        if any(needle in step_text_lower for needle in _ingredient_needles(ingredient.name)):
             found_ingredients.append(ingredient)
-            continue
 
-        # Check with "the" prefix
-        if f"the {name_lower}" in step_text_lower:
-            found_ingredients.append(ingredient)
-            continue
+    return found_ingredients
 
-        # Check for plural forms
-        if f"{name_lower}s" in step_text_lower:
-            found_ingredients.append(ingredient)
-            continue
 
-        # Check for partial matches (e.g., "chicken" in "chicken breast")
-        name_parts = name_lower.split()
-        if any(part in step_text_lower for part in name_parts if len(part) > 3):
-            found_ingredients.append(ingredient)
+@lru_cache(maxsize=512)
+def _ingredient_needles(name: str) -> tuple[str, ...]:
+    """Substrings whose presence in a lowercased step means the ingredient is mentioned.
 
-    return found_ingredients
+    The full name comes first; "the <name>" and the plural "<name>s" both contain it, so they
+    need no separate check. Then come the longer words of the name, since "chicken" in a step
+    refers to "chicken breast".
+
+    Args:
+        name: Ingredient name
+
+    Returns:
+        Tuple of lowercase substrings to look for
+    """
+    name_lower = lower_text(name)
+    return (name_lower, *(part for part in name_lower.split() if len(part) > 3))
 
 
 def parse_steps_from_directions(
@@ -380,52 +472,168 @@ def parse_steps_from_directions(
     if context is None:
         context = {}
 
-    steps = []
-    step_number = 1
+    atomic_steps = _split_directions(directions, split_by_atomic_steps, use_spacy)
+
+    # With spaCy, each distinct text is parsed once in an nlp.pipe batch and the Doc is handed
+    # to every extractor, instead of each extractor calling nlp() on the same text
+    step_docs: dict[str, Doc] = {}
+    if use_spacy:
+        unique_steps = list(dict.fromkeys(atomic_steps))
+        step_docs = dict(zip(unique_steps, get_nlp().pipe(unique_steps, batch_size=64), strict=True))
+
+    return _build_steps(atomic_steps, all_ingredients, context, use_spacy, step_docs)
+
+
+# Worker processes each load the spaCy model, which only pays off for large batches of step texts
+MULTIPROCESS_MIN_STEPS = 1000
+
+
+def parse_steps_for_many_recipes(
+    recipes: list[tuple[list[str], list[Ingredient]]],
+    split_by_atomic_steps: bool = True,
+    n_process: int | None = None,
+    batch_size: int = 64,
+) -> list[list[Step]]:
+    """Parse the directions of many recipes, spreading the spaCy work over several processes.
 
+    The atomic steps of all recipes are parsed in a single `nlp.pipe` call, spread over several
+    processes when there are enough of them; each recipe is then assembled as
+    `parse_steps_from_directions` (with spaCy) would, its oven temperature context starting empty.
+
+    Args:
+        recipes: One (directions, ingredients) pair per recipe
+        split_by_atomic_steps: Whether to split complex directions into atomic steps
+        n_process: Number of worker processes (default: one, or all cores but one once there are
+            more than `MULTIPROCESS_MIN_STEPS` distinct steps)
+        batch_size: Number of texts sent to a worker at a time
+
+    Returns:
+        One list of parsed Step objects per recipe, in input order
+    """
+    recipe_steps = [_split_directions(directions, split_by_atomic_steps, True) for directions, _ in recipes]
+    unique_steps = list(dict.fromkeys(chain.from_iterable(recipe_steps)))
+
+    if n_process is None:
+        n_process = max(1, (os.cpu_count() or 1) - 1) if len(unique_steps) > MULTIPROCESS_MIN_STEPS else 1
+    docs = get_nlp().pipe(unique_steps, n_process=n_process, batch_size=batch_size)
+    step_docs = dict(zip(unique_steps, docs, strict=True))
+
+    return [
+        _build_steps(atomic_steps, all_ingredients, {}, True, step_docs)
+        for atomic_steps, (_, all_ingredients) in zip(recipe_steps, recipes, strict=True)
+    ]
+
+
+def _split_directions(directions: list[str], split_by_atomic_steps: bool, use_spacy: bool) -> list[str]:
+    """Split directions into atomic steps, in order.
+
+    Repeated direction strings are only split once (by the rule-based sentencizer with spaCy).
+
+    Args:
+        directions: List of direction strings
+        split_by_atomic_steps: Whether to split complex directions into atomic steps
+        use_spacy: Whether to use spaCy-based splitting
+
+    Returns:
+        List of atomic step descriptions
+    """
+    if not split_by_atomic_steps:
+        return list(directions)
+
+    unique_directions = list(dict.fromkeys(directions))
+    direction_docs = (
+        get_sentencizer_nlp().pipe(unique_directions, batch_size=64) if use_spacy else [None] * len(unique_directions)
+    )
+    split_cache = {
+        direction: split_into_atomic_steps(direction, use_spacy=use_spacy, doc=doc)
+        for direction, doc in zip(unique_directions, direction_docs, strict=True)
+    }
+    atomic_steps = []
     for direction in directions:
-        # Split into atomic steps if needed
-        atomic_steps = split_into_atomic_steps(direction, use_spacy=use_spacy) if split_by_atomic_steps else [direction]
+        atomic_steps.extend(split_cache[direction])
+    return atomic_steps
 
-        for atomic_step in atomic_steps:
+
+def _build_steps(
+    atomic_steps: list[str],
+    all_ingredients: list[Ingredient],
+    context: dict,
+    use_spacy: bool,
+    step_docs: dict[str, Doc],
+) -> list[Step]:
+    """Extract the metadata of each atomic step and build the Step objects.
+
+    Args:
+        atomic_steps: Atomic step descriptions, in order
+        all_ingredients: List of ingredients in recipe
+        context: Context carried forward between steps (e.g., oven temperature), updated in place
+        use_spacy: Whether to use spaCy-based parsing
+        step_docs: Parsed Doc of every atomic step (spaCy only)
+
+    Returns:
+        List of parsed Step objects
+    """
+    ingredient_lemmas: dict[str, frozenset[str]] | None = None
+    if use_spacy:
+        # Ingredient names are parsed once per recipe rather than once per step
+        ingredient_lemmas = ingredient_lemma_sets(
+            (ingredient.name for ingredient in all_ingredients if ingredient.name is not None), get_nlp()
+        )
+        step_methods = extract_methods_batch(
+            atomic_steps, use_spacy=True, docs=[step_docs[atomic_step] for atomic_step in atomic_steps]
+        )
+    else:
+        step_methods = extract_methods_batch(atomic_steps, use_spacy=False)
+
+    # Per-text results, so duplicate steps reuse the extraction work
+    step_cache: dict[str, tuple] = {}
+
+    steps = []
+    for step_number, (atomic_step, (primary_methods, secondary_methods)) in enumerate(
+        zip(atomic_steps, step_methods, strict=True), 1
+    ):
+        if atomic_step not in step_cache:
             # Extract all metadata using spaCy-enhanced functions
-            tools = extract_tools_from_text(atomic_step, use_spacy=use_spacy)
-            primary_methods, secondary_methods = extract_methods_from_text(atomic_step, use_spacy=use_spacy)
-            all_methods = primary_methods + secondary_methods
-
-            time_info = extract_time_from_text(atomic_step, use_spacy=use_spacy)
-            temp_info = extract_temperature_from_text(atomic_step, use_spacy=use_spacy)
-
-            # Carry forward oven temperature from context if baking/roasting
-            if any(method in ["bake", "baking", "roast", "roasting"] for method in primary_methods):
-                if "oven" not in temp_info and "oven_temp" in context:
-                    temp_info["oven"] = context["oven_temp"]
-
-            # Update context with new temperature
-            if "oven" in temp_info:
-                context["oven_temp"] = temp_info["oven"]
-
-            # Classify step
-            actionable, is_prepared, info_type = classify_step_type(atomic_step, use_spacy=use_spacy)
-
-            # Find ingredients mentioned in this step
-            step_ingredients = extract_ingredients_from_step(atomic_step, all_ingredients, use_spacy=use_spacy)
-
-            # Create Step object
-            step = Step(
-                step_number=step_number,
-                description=atomic_step,
-                ingredients=step_ingredients,
-                tools=tools,
-                methods=all_methods,
-                time=time_info,
-                temperature=temp_info,
-                actionable=actionable,
-                is_prepared=is_prepared,
-                info_type=info_type,
+            doc = step_docs.get(atomic_step)
+            step_cache[atomic_step] = (
+                extract_tools_from_text(atomic_step, use_spacy=use_spacy, doc=doc),
+                extract_time_from_text(atomic_step, use_spacy=use_spacy, doc=doc),
+                extract_temperature_from_text(atomic_step, use_spacy=use_spacy, doc=doc),
+                classify_step_type(atomic_step, use_spacy=use_spacy, doc=doc),
+                extract_ingredients_from_step(
+                    atomic_step, all_ingredients, use_spacy=use_spacy, doc=doc, ingredient_lemmas=ingredient_lemmas
+                ),
             )
-
-            steps.append(step)
-            step_number += 1
+        tools, time_info, temp_info, step_type, step_ingredients = step_cache[atomic_step]
+        all_methods = primary_methods + secondary_methods
+        # Copy, since the oven temperature from context may be filled in below
+        temp_info = dict(temp_info)
+
+        # Carry forward oven temperature from context if baking/roasting
+        if any(method in ["bake", "baking", "roast", "roasting"] for method in primary_methods):
+            if "oven" not in temp_info and "oven_temp" in context:
+                temp_info["oven"] = context["oven_temp"]
+
+        # Update context with new temperature
+        if "oven" in temp_info:
+            context["oven_temp"] = temp_info["oven"]
+
+        actionable, is_prepared, info_type = step_type
+
+        # Create Step object
+        step = Step(
+            step_number=step_number,
+            description=atomic_step,
+            ingredients=list(step_ingredients),
+            tools=list(tools),
+            methods=all_methods,
+            time=StepTime(**time_info),
+            temperature=StepTemperature(**temp_info),
+            actionable=actionable,
+            is_prepared=is_prepared,
+            info_type=info_type,
+        )
+
+        steps.append(step)
 
     return steps
@@ -0,0 +1,19 @@
+"""Small text helpers shared by the parsers."""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def lower_text(text: str) -> str:
+    """Lowercase text, memoized.
+
+    The same step description (and ingredient name) is lowercased by several extractors while a
+    recipe is parsed, so repeated calls return the cached result.
+
+    Args:
+        text: Text to lowercase
+
+    Returns:
+        Lowercased text
+    """
+    return text.lower()
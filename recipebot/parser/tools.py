@@ -1,8 +1,13 @@
 """Kitchen tools database and extraction utilities."""
 
+import threading
+from functools import lru_cache
+
 from spacy.matcher import PhraseMatcher
+from spacy.tokens import Doc
 
 from .spacy_utils import get_nlp
+from .text_utils import lower_text
 
 # Comprehensive kitchen tools database
 TOOLS_DATABASE = {
@@ -150,6 +155,9 @@ ALL_TOOLS: set[str] = set()
 for category in TOOLS_DATABASE.values():
     ALL_TOOLS.update(category)
 
+# Fixed iteration order, so legacy extraction reports tools in the same order in every process
+_SORTED_TOOLS = tuple(sorted(ALL_TOOLS))
+
 # Action-to-tool inference mapping
 ACTION_TO_TOOL = {
     "whisk": "whisk",
@@ -195,52 +203,108 @@ ACTION_TO_TOOL = {
 }
 
 
-def extract_tools_from_text(text: str, use_spacy: bool = True) -> list[str]:
+def _group_actions_by_tool(action_to_tool: dict[str, str]) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Group the inference actions by tool, dropping actions that contain another of the same tool.
+
+    "whisking" can only appear where "whisk" does, so it never infers anything new.
+
+    Args:
+        action_to_tool: Mapping of action to the tool it implies
+
+    Returns:
+        Tuple of (tool, actions) pairs, in order of each tool's first action
+    """
+    actions_by_tool: dict[str, list[str]] = {}
+    for action, tool in action_to_tool.items():
+        actions_by_tool.setdefault(tool, []).append(action)
+    return tuple(
+        (tool, tuple(action for action in actions if not any(other != action and other in action for other in actions)))
+        for tool, actions in actions_by_tool.items()
+    )
+
+
+_ACTIONS_BY_TOOL = _group_actions_by_tool(ACTION_TO_TOOL)
+
+
+def extract_tools_from_text(text: str, use_spacy: bool = True, doc: Doc | None = None) -> list[str]:
     """Extract kitchen tools mentioned in text.
 
     Args:
         text: Text to extract tools from (e.g., step description)
         use_spacy: Whether to use spaCy-based extraction (default: True)
+        doc: Already parsed `text`, to skip parsing it again (spaCy only)
 
     Returns:
         List of identified tools
     """
     if use_spacy:
-        return _extract_tools_with_spacy(text)
+        return _extract_tools_with_spacy(text, doc)
     else:
-        return _extract_tools_legacy(text)
+        return list(_extract_tools_legacy(text))
 
 
-def _extract_tools_with_spacy(text: str) -> list[str]:
+# Tool matchers (lazy loaded, shared by all calls)
+_tool_matchers: tuple[frozenset[str], PhraseMatcher] | None = None
+_tool_matchers_lock = threading.Lock()
+
+
+def _get_tool_matchers() -> tuple[frozenset[str], PhraseMatcher]:
+    """Get or build the tool matchers.
+
+    Most tools are a single token, and a set lookup on each token's lowercase text finds those;
+    only the multi-token tools (e.g. "cutting board") go into the PhraseMatcher.
+
+    Returns:
+        Tuple of (single_token_tools, multi_token_tool_matcher)
+    """
+    global _tool_matchers
+    if _tool_matchers is None:
+        with _tool_matchers_lock:
+            if _tool_matchers is None:
+                nlp = get_nlp()
+                single_token_tools = set()
+                tool_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+                multi_token_patterns = []
+                for pattern in nlp.tokenizer.pipe(sorted(ALL_TOOLS)):
+                    if len(pattern) == 1:
+                        single_token_tools.add(pattern.text.lower())
+                    else:
+                        multi_token_patterns.append(pattern)
+                tool_matcher.add("TOOL", multi_token_patterns)
+                _tool_matchers = (frozenset(single_token_tools), tool_matcher)
+    return _tool_matchers
+
+
+def _extract_tools_with_spacy(text: str, doc: Doc | None = None) -> list[str]:
     """Extract tools using spaCy's advanced matching.
 
     Args:
         text: Text to extract tools from
+        doc: Already parsed `text`, if available
 
     Returns:
         List of identified tools
     """
     nlp = get_nlp()
-    doc = nlp(text)
+    if doc is None:
+        doc = nlp(text)
     found_tools: list[str] = []
     seen: set[str] = set()
 
-    # Create phrase matcher for tools
-    tool_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
-    # Sort tools by length (longest first) to match longer phrases first
-    sorted_tools = sorted(ALL_TOOLS, key=len, reverse=True)
-    patterns = [nlp.make_doc(tool) for tool in sorted_tools]
-    tool_matcher.add("TOOL", patterns)
+    single_token_tools, tool_matcher = _get_tool_matchers()
 
     # Track matched spans to avoid redundancy
     matched_spans = set()
 
-    # Find explicit tool mentions (prioritize longer matches)
-    matches = tool_matcher(doc)
+    # Find explicit tool mentions (prioritize longer matches): one-token tools by a set lookup
+    # per token, multi-token ones with the phrase matcher, both in document order
+    matches = [(token.i, token.i + 1) for token in doc if token.lower_ in single_token_tools]
+    matches.extend((start, end) for _match_id, start, end in tool_matcher(doc))
+    matches.sort()
     # Sort matches by length (longest first) to prioritize specific tools
-    sorted_matches = sorted(matches, key=lambda m: m[2] - m[1], reverse=True)
+    sorted_matches = sorted(matches, key=lambda m: m[1] - m[0], reverse=True)
 
-    for _match_id, start, end in sorted_matches:
+    for start, end in sorted_matches:
         span_range = (start, end)
         tool = doc[start:end].text.lower()
 
@@ -281,39 +345,33 @@ def _extract_tools_with_spacy(text: str) -> list[str]:
     return found_tools
 
 
-def _extract_tools_legacy(text: str) -> list[str]:
+@lru_cache(maxsize=4096)
+def _extract_tools_legacy(text: str) -> tuple[str, ...]:
     """Legacy regex-based tool extraction (fallback).
 
+    Memoized, since recipes repeat step phrasing; returns a tuple so cached results stay immutable.
+
     Args:
         text: Text to extract tools from
 
     Returns:
-        List of identified tools
+        Identified tools
     """
-    text_lower = text.lower()
-    found_tools = []
+    text_lower = lower_text(text)
 
     # Check for explicit tool mentions
-    for tool in ALL_TOOLS:
-        if tool in text_lower:
-            found_tools.append(tool)
-
-    # Infer tools from actions
-    for action, tool in ACTION_TO_TOOL.items():
-        if action in text_lower and tool not in found_tools:
-            # Only add if not already found explicitly
-            if tool not in found_tools:
-                found_tools.append(tool)
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_tools = []
-    for tool in found_tools:
-        if tool not in seen:
-            seen.add(tool)
-            unique_tools.append(tool)
+    found_tools = dict.fromkeys(tool for tool in _SORTED_TOOLS if tool in text_lower)
+
+    # Infer tools from actions (only if not already found explicitly)
+    for tool, actions in _ACTIONS_BY_TOOL:
+        if tool in found_tools:
+            continue
+        for action in actions:
+            if action in text_lower:
+                found_tools[tool] = None
+                break
 
-    return unique_tools
+    return tuple(found_tools)
 
 
 def get_tools_by_category(category: str) -> set[str]:
@@ -1,18 +1,54 @@
-from typing import Literal
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Literal
 
 import yt_dlp
 from ddgs import DDGS
-from pydantic import BaseModel, Field
 
 
-class SearchResult(BaseModel):
-    title: str = Field(..., description="The title of searching item")
-    url: str = Field(..., description="The url of searching item")
-    source: str = Field(..., description="Where the searching item is searched")
-    id: str | None = Field(default=None, description="The id of searching item")
-    duration: int | None = Field(default=None, description="The duration of searching item")
-    view_count: int | None = Field(default=None, description="The view count of searching item")
-    reponse: dict[str, str] | None = Field(default=None, description="The response of searching item")
+@dataclass(slots=True)
+class SearchResult:
+    """A single search hit.
+
+    Built internally from yt-dlp and DDGS records, so it skips validation and per-instance dicts;
+    pydantic still serializes it when it is returned from an agent tool.
+    """
+
+    title: str
+    """The title of searching item"""
+    url: str
+    """The url of searching item"""
+    source: str
+    """Where the searching item is searched"""
+    id: str | None = None
+    """The id of searching item"""
+    duration: int | None = None
+    """The duration of searching item"""
+    view_count: int | None = None
+    """The view count of searching item"""
+    reponse: dict[str, Any] | None = None
+    """The response of searching item"""
+
+
+# Metadata-only search options; YoutubeDL fills in defaults in place, so pass it a copy
+_YDL_OPTS = {
+    "quiet": True,
+    "no_warnings": True,
+    "extract_flat": True,  # Don't download, just get metadata
+}
+
+
+@lru_cache(maxsize=1)
+def _ddgs() -> DDGS:
+    """Return a shared DDGS client so its engine instances and HTTP sessions are reused across searches."""
+    return DDGS()
+
+
+# Result field holding the link, per DuckDuckGo search type (each is also the DDGS method name)
+_DDGS_URL_KEYS = {"text": "href", "news": "url", "images": "image", "videos": "content"}
 
 
 def modify_query(query: str) -> str:
@@ -20,17 +56,14 @@ def modify_query(query: str) -> str:
     return f"{query} cooking kitchen recipe food technique"
 
 
+SearchSource = Literal["youtube", "text", "news", "images", "videos"]
+
+
 def search_youtube(query, max_results=5):
     """Search YouTube for videos related to the query."""
     query = modify_query(query)
 
-    ydl_opts = {
-        "quiet": True,
-        "no_warnings": True,
-        "extract_flat": True,  # Don't download, just get metadata
-    }
-
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+    with yt_dlp.YoutubeDL(dict(_YDL_OPTS)) as ydl:
         search_results = ydl.extract_info(f"ytsearch{max_results}:{query}", download=False)
 
         videos = []
@@ -117,46 +150,59 @@ def search_duckduckgo(
             'uploader': 'In The Kitchen With Matt'
             }
     """
+    url_key = _DDGS_URL_KEYS.get(search_type)
+    if url_key is None:
+        raise ValueError(f"Unsupported search type {search_type!r}; expected one of {', '.join(_DDGS_URL_KEYS)}")
     query = modify_query(query)
-
-    match search_type:
-        case "text":
-            return [
-                SearchResult(
-                    title=result["title"],
-                    url=result["href"],
-                    source="DDG",
-                    reponse=result,
-                )
-                for result in DDGS().text(query, region=region, max_results=max_results)
-            ]
-        case "news":
-            return [
-                SearchResult(
-                    title=result["title"],
-                    url=result["url"],
-                    source="DDG",
-                    reponse=result,
-                )
-                for result in DDGS().news(query, region=region, max_results=max_results)
-            ]
-        case "images":
-            return [
-                SearchResult(
-                    title=result["title"],
-                    url=result["image"],
-                    source="DDG",
-                    reponse=result,
-                )
-                for result in DDGS().images(query, region=region, max_results=max_results)
-            ]
-        case "videos":
-            return [
-                SearchResult(
-                    title=result["title"],
-                    url=result["content"],
-                    source="DDG",
-                    reponse=result,
-                )
-                for result in DDGS().videos(query, region=region, max_results=max_results)
-            ]
+    search = getattr(_ddgs(), search_type)
+    return [
+        SearchResult(
+            title=result["title"],
+            url=result[url_key],
+            source="DDG",
+            reponse=result,
+        )
+        for result in search(query, region=region, max_results=max_results)
+    ]
+
+
+async def asearch_youtube(query: str, max_results: int = 5) -> list[SearchResult]:
+    """Async `search_youtube`; runs the blocking search on a worker thread so other awaits proceed."""
+    return await asyncio.to_thread(search_youtube, query, max_results)
+
+
+async def asearch_duckduckgo(
+    query: str,
+    search_type: Literal["text", "news", "images", "videos"] = "text",
+    max_results: int = 10,
+    region: str = "us-en",
+) -> list[SearchResult]:
+    """Async `search_duckduckgo`; runs the blocking search on a worker thread so other awaits proceed."""
+    return await asyncio.to_thread(search_duckduckgo, query, search_type, max_results, region)
+
+
+def search_all(
+    query: str, sources: Sequence[SearchSource] = ("youtube", "text"), max_results: int = 5
+) -> list[SearchResult]:
+    """Search several sources concurrently and merge the results.
+
+    Each search is network-bound, so running them on separate threads makes the total
+    latency roughly that of the slowest source. The shared DDGS client only caches engine
+    instances between calls, so concurrent searches can use it.
+
+    Args:
+        query: The search query
+        sources: "youtube" and/or DuckDuckGo search types to query
+        max_results: Maximum number of results per source
+
+    Returns:
+        list[SearchResult]: Results grouped by source, in the order the sources were given
+    """
+    with ThreadPoolExecutor(max_workers=len(sources) or 1, thread_name_prefix="recipebot-search") as executor:
+        futures = [
+            executor.submit(search_youtube, query, max_results)
+            if source == "youtube"
+            else executor.submit(search_duckduckgo, query, source, max_results)
+            for source in sources
+        ]
+        return [result for future in futures for result in future.result()]
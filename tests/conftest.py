@@ -1,6 +1,41 @@
+import threading
+from functools import lru_cache
+
 import pytest
+import rich
+from rich.console import Console
 
+from recipebot import crawler
 from recipebot.model import Ingredient
+from recipebot.parser.spacy_utils import get_nlp
+
+RECIPE_URLS: dict[str, tuple[str, ...]] = {
+    "allrecipes": (
+        "https://www.allrecipes.com/recipe/24074/alysias-basic-meat-lasagna/",
+        "https://www.allrecipes.com/recipe/20096/cheesy-ham-and-hash-brown-casserole/",
+        "https://www.allrecipes.com/recipe/166160/juicy-thanksgiving-turkey/",
+        "https://www.allrecipes.com/recipe/238577/homemade-bread-stuffing/",
+        "https://www.allrecipes.com/recipe/6820/downeast-maine-pumpkin-bread/",
+        "https://www.allrecipes.com/recipe/54614/turkey-brine/",
+    ),
+    "seriouseats": (
+        "https://www.seriouseats.com/baked-sweet-potato-fries-recipe-11839467",
+        "https://www.seriouseats.com/ultra-fluffy-mashed-potatoes-recipe",
+        "https://www.seriouseats.com/roasted-brussels-sprouts-bacon-pecans-maple-balsamic-recipe",
+    ),
+}
+
+
+def _warm_up_nlp():
+    try:
+        get_nlp()
+    except RuntimeError:
+        pass  # The model is missing; the spaCy tests report it when they call get_nlp themselves
+
+
+def pytest_configure(config):
+    # Load the spaCy model while tests are collected, so the first spaCy test doesn't wait for it
+    threading.Thread(target=_warm_up_nlp, name="recipebot-nlp-warmup", daemon=True).start()
 
 
 @pytest.fixture
@@ -32,30 +67,45 @@ def ingredients():
     ]
 
 
-@pytest.fixture
-def urls() -> dict[str, list[str]]:
-    return {
-        "allrecipes": [
-            "https://www.allrecipes.com/recipe/24074/alysias-basic-meat-lasagna/",
-            "https://www.allrecipes.com/recipe/20096/cheesy-ham-and-hash-brown-casserole/",
-            "https://www.allrecipes.com/recipe/166160/juicy-thanksgiving-turkey/",
-            "https://www.allrecipes.com/recipe/238577/homemade-bread-stuffing/",
-            "https://www.allrecipes.com/recipe/6820/downeast-maine-pumpkin-bread/",
-            "https://www.allrecipes.com/recipe/54614/turkey-brine/",
-        ],
-        "seriouseats": [
-            "https://www.seriouseats.com/baked-sweet-potato-fries-recipe-11839467",
-            "https://www.seriouseats.com/ultra-fluffy-mashed-potatoes-recipe",
-            "https://www.seriouseats.com/roasted-brussels-sprouts-bacon-pecans-maple-balsamic-recipe",
-        ],
-    }
+# Immutable, so one copy is safely shared by the whole session and can key memoized helpers
+@pytest.fixture(scope="session")
+def urls() -> dict[str, tuple[str, ...]]:
+    return RECIPE_URLS
 
 
-@pytest.fixture
-def allrecipes_url(urls) -> list[str]:
+@pytest.fixture(scope="session")
+def allrecipes_url(urls) -> tuple[str, ...]:
     return urls["allrecipes"]
 
 
-@pytest.fixture
-def seriouseats_url(urls) -> list[str]:
+@pytest.fixture(scope="session")
+def seriouseats_url(urls) -> tuple[str, ...]:
     return urls["seriouseats"]
+
+
+@pytest.fixture(scope="session")
+def scraper():
+    # recipe-scrapers view of the first allrecipes page, downloaded and parsed once per session
+    from recipe_scrapers import scrape_me
+
+    return scrape_me(RECIPE_URLS["allrecipes"][0])
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _cached_downloads():
+    # Each recipe page is downloaded once per test session, however many tests scrape it
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(crawler, "_fetch", lru_cache(maxsize=None)(crawler._fetch))
+        yield
+
+
+@pytest.fixture(scope="session")
+def console() -> Console:
+    # The console behind `rich.print`, so every test writes through one instance
+    return rich.get_console()
+
+
+def pytest_generate_tests(metafunc):
+    # One test per recipe URL, so each page is reported (and can be distributed) on its own
+    if "recipe_url" in metafunc.fixturenames:
+        metafunc.parametrize("recipe_url", [url for site_urls in RECIPE_URLS.values() for url in site_urls])
@@ -0,0 +1,46 @@
+import asyncio
+
+from pydantic_ai.messages import ModelMessage, ModelRequest, ToolReturnPart
+from pydantic_ai.models.function import AgentInfo, DeltaToolCall, FunctionModel
+
+from recipebot.hybrid.agent import HybridAgent
+from recipebot.model import Recipe, Step
+
+
+async def _text_then_navigate(messages: list[ModelMessage], info: AgentInfo):
+    # Gemini often sends its reply text and a tool call in the same response
+    if any(
+        isinstance(part, ToolReturnPart)
+        for message in messages
+        if isinstance(message, ModelRequest)
+        for part in message.parts
+    ):
+        yield "Here is step 2."
+        return
+    yield "Moving on. "
+    yield {0: DeltaToolCall(name="navigate_step", json_args='{"action": "next"}', tool_call_id="nav")}
+
+
+def test_ask_stream_runs_tool_calls_sent_with_text(monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test")
+    assistant = HybridAgent()
+    assistant._set_recipe(
+        Recipe(
+            url="https://example.com/recipe",
+            title="Test",
+            ingredients=[],
+            directions=["Mix.", "Bake."],
+            steps=[Step(step_number=1, description="Mix."), Step(step_number=2, description="Bake.")],
+        )
+    )
+    assistant.current_step = 1
+
+    async def collect():
+        return [chunk async for chunk in assistant.ask_stream("I'm done with this part, what comes after it?")]
+
+    model = FunctionModel(stream_function=_text_then_navigate)
+    with assistant.agent_lite.override(model=model), assistant.agent_flash.override(model=model):
+        chunks = asyncio.run(collect())
+
+    assert "".join(chunks) == "Moving on. Here is step 2."
+    assert assistant.current_step == 2
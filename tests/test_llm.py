@@ -0,0 +1,31 @@
+from google.generativeai import protos
+from google.generativeai.types import generation_types
+
+from recipebot.llm import agent as llm_agent
+
+
+def _chunk(text: str, finish_reason: int = 0) -> protos.GenerateContentResponse:
+    content = protos.Content(role="model", parts=[protos.Part(text=text)])
+    return protos.GenerateContentResponse(candidates=[protos.Candidate(content=content, finish_reason=finish_reason)])
+
+
+def test_ask_stream_rewinds_after_cut_off_answer(monkeypatch):
+    monkeypatch.setattr(llm_agent, "GEMINI_API_KEY", "test")
+    assistant = llm_agent.RecipeAssistant()
+    assistant.current_recipe_text = "Recipe: toast"
+    assistant.chat = assistant.model.start_chat(history=[{"role": "user", "parts": ["Recipe: toast"]}])
+
+    stopped = protos.Candidate.FinishReason.SAFETY
+    replies = iter(
+        [[_chunk("Toast the "), _chunk("", stopped)], [_chunk("Two minutes.", protos.Candidate.FinishReason.STOP)]]
+    )
+    monkeypatch.setattr(
+        assistant.model,
+        "generate_content",
+        lambda **kwargs: generation_types.GenerateContentResponse.from_iterator(iter(next(replies))),
+    )
+
+    assert "Error generating response" in assistant.ask("How do I toast it?")
+    # The broken turn is dropped, so the chat keeps working
+    assert assistant.ask("How long?") == "Two minutes."
+    assert len(assistant.chat.history) == 3
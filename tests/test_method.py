@@ -1,6 +1,6 @@
 from rich import print
 
-from recipebot.parser import extract_methods_from_text
+from recipebot.parser import extract_methods_batch, extract_methods_from_text
 
 
 def test_method_extraction(directions):
@@ -9,3 +9,8 @@ def test_method_extraction(directions):
         print(f"\nText: {test}")
         print(f"Primary: {', '.join(primary) if primary else 'None'}")
         print(f"Secondary: {', '.join(secondary) if secondary else 'None'}")
+
+
+def test_method_extraction_batch(directions):
+    batch = extract_methods_batch(directions)
+    assert batch == [extract_methods_from_text(text) for text in directions]
@@ -1,24 +1,25 @@
 import pytest
-from rich.console import Console
 
-from recipebot.parser import parse_recipe, show_recipe
-
-console = Console()
+from recipebot.parser import parse_recipe, parse_recipes, show_recipe
 
 
 @pytest.mark.skip(reason="This test is for reference only. It uses the recipe-scrapers library.")
-def test_scraper_by_recipe(allrecipes_url, seriouseats_url):
-    from recipe_scrapers import scrape_me
-
-    scraper = scrape_me(allrecipes_url[0])
+def test_scraper_by_recipe(scraper, console):
     console.print(scraper)
     console.print(scraper.title())
     console.print(scraper.instructions())
     console.print(scraper.to_json())
 
 
-def test_scrape(allrecipes_url, seriouseats_url):
-    for url in allrecipes_url + seriouseats_url:
-        recipe = parse_recipe(url, split_by_atomic_steps=True)
-        console.print(recipe.directions)
-        show_recipe(recipe)
+def test_scrape(recipe_url, console):
+    recipe = parse_recipe(recipe_url, split_by_atomic_steps=True)
+    console.print(recipe.directions)
+    show_recipe(recipe, console)
+
+
+def test_scrape_concurrently(allrecipes_url, seriouseats_url, console):
+    urls = allrecipes_url + seriouseats_url
+    recipes = parse_recipes(urls, split_by_atomic_steps=True)
+    assert tuple(recipe.url for recipe in recipes) == urls
+    for recipe in recipes:
+        show_recipe(recipe, console)
@@ -1,6 +1,9 @@
+import asyncio
+
+import pytest
 from rich import print
 
-from recipebot.search import search_duckduckgo, search_youtube
+from recipebot.search import asearch_duckduckgo, asearch_youtube, search_all, search_duckduckgo, search_youtube
 
 
 def test_search_youtube():
@@ -24,3 +27,21 @@ def test_search_web():
 def test_search_beef():
     result = search_duckduckgo("how to make beef", search_type="text", max_results=5)
     print(result)
+
+
+def test_search_unsupported_type():
+    with pytest.raises(ValueError, match="text, news, images, videos"):
+        search_duckduckgo("how to make beef", search_type="maps")
+
+
+def test_search_all():
+    results = search_all("how to make salad", sources=("youtube", "text"), max_results=3)
+    print(results)
+
+
+def test_search_parallel():
+    async def search_both(query):
+        return await asyncio.gather(asearch_youtube(query, 3), asearch_duckduckgo(query, "videos", 3))
+
+    videos, web_videos = asyncio.run(search_both("how to make salad"))
+    print(videos, web_videos)
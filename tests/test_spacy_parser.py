@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Test suite for spaCy-based parsing optimizations."""
 
+import spacy
 from rich import print
 
 from recipebot.parser import methods, step, tools
+from recipebot.parser.spacy_utils import create_time_matcher, extract_time_with_spacy, get_nlp
 
 
 def test_time_extraction():
@@ -17,12 +19,25 @@ def test_time_extraction():
         "Bake until tender and cooked through",
     ]
 
-    for text in test_cases:
-        result = step.extract_time_from_text(text, use_spacy=True)
+    for text, doc in zip(test_cases, get_nlp().pipe(test_cases), strict=True):
+        result = step.extract_time_from_text(text, use_spacy=True, doc=doc)
         print(f"Text: {text}")
         print(f"  Result: {result}")
 
 
+def test_time_extraction_takes_first_range():
+    """The first of several time ranges in a step wins, not the longest one."""
+    # The time patterns only need token attributes, so a blank pipeline is enough
+    nlp = spacy.blank("en")
+    time_matcher = create_time_matcher(nlp)
+
+    doc = nlp("Simmer 10 to 15 minutes, then cook 30 to 45 more minutes.")
+    assert extract_time_with_spacy(doc, time_matcher) == {"duration_min": 10, "duration_max": 15, "unit": "minute"}
+
+    doc = nlp("Bake 20 to 25 minutes and then 2 ½ to 3 hours.")
+    assert extract_time_with_spacy(doc, time_matcher) == {"duration_min": 20, "duration_max": 25, "unit": "minute"}
+
+
 def test_temperature_extraction():
     """Test temperature extraction with spaCy."""
     test_cases = [
@@ -33,8 +48,8 @@ def test_temperature_extraction():
         "Roast at high heat",
     ]
 
-    for text in test_cases:
-        result = step.extract_temperature_from_text(text, use_spacy=True)
+    for text, doc in zip(test_cases, get_nlp().pipe(test_cases), strict=True):
+        result = step.extract_temperature_from_text(text, use_spacy=True, doc=doc)
         print(f"Text: {text}")
         print(f"  Result: {result}")
 
@@ -50,8 +65,8 @@ def test_tool_extraction():
         "Blend until smooth using an immersion blender",
     ]
 
-    for text in test_cases:
-        result = tools.extract_tools_from_text(text, use_spacy=True)
+    for text, doc in zip(test_cases, get_nlp().pipe(test_cases), strict=True):
+        result = tools.extract_tools_from_text(text, use_spacy=True, doc=doc)
         print(f"Text: {text}")
         print(f"  Tools: {result}")
 
@@ -66,8 +81,8 @@ def test_method_extraction():
         "Boil water, add pasta, and simmer for 10 minutes",
     ]
 
-    for text in test_cases:
-        primary, secondary = methods.extract_methods_from_text(text, use_spacy=True)
+    results = methods.extract_methods_batch(test_cases, use_spacy=True)
+    for text, (primary, secondary) in zip(test_cases, results, strict=True):
         print(f"Text: {text}")
         print(f"  Primary: {primary}")
         print(f"  Secondary: {secondary}")
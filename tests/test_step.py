@@ -1,6 +1,12 @@
 from rich import print
 
-from recipebot.parser.step import parse_steps_from_directions
+from recipebot.parser import steps_table
+from recipebot.parser.step import (
+    LEADING_CONJUNCTION,
+    SENTENCE_SPLITTERS,
+    parse_steps_from_directions,
+    split_into_atomic_steps,
+)
 
 
 def test_step_parsing(directions, ingredients):
@@ -8,11 +14,16 @@ def test_step_parsing(directions, ingredients):
     print(f"Ingredients ({len(ingredients)}): {ingredients}")
     steps = parse_steps_from_directions(directions, ingredients)
 
-    for step in steps:
-        print(f"\nStep {step.step_number}: {step.description}")
-        print(f"  Ingredients: {[ing.name for ing in step.ingredients]}")
-        print(f"  Tools: {step.tools}")
-        print(f"  Methods: {step.methods}")
-        print(f"  Time: {step.time}")
-        print(f"  Temperature: {step.temperature}")
-        print(f"  Actionable: {step.actionable}, Prepared: {step.is_prepared}")
+    print(steps_table(steps))
+
+
+def test_atomic_step_splitting_single_pass(directions):
+    # The combined splitter must give the same steps as applying each splitter in turn
+    for direction in directions:
+        steps = [direction]
+        for splitter in SENTENCE_SPLITTERS:
+            steps = [part.strip() for step in steps for part in splitter.split(step) if part.strip()]
+        steps = [LEADING_CONJUNCTION.sub("", step) for step in steps]
+        expected = [step[0].upper() + step[1:] for step in steps if step]
+
+        assert split_into_atomic_steps(direction, use_spacy=False) == expected